@@ -31,37 +31,416 @@ Dependencies:
 
 import os
 import logging
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import re
+import hashlib
+import pickle
+import orjson
 from bs4 import BeautifulSoup as bs
-from datetime import datetime
-from typing import Optional, Dict, Union
-from dotenv import load_dotenv
+from selectolax.lexbor import LexborHTMLParser
+from collections import namedtuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import wraps, lru_cache
+from html import unescape
+from typing import Optional, Dict, Callable
+from dotenv import load_dotenv, find_dotenv
 from together import Together
 from telegram import Bot
+from telegram.request import HTTPXRequest
 import asyncio
-from groq import Groq
+from groq import AsyncGroq
 import random
+import itertools
+import threading
 import io
+import struct
+from binascii import a2b_base64
 from PIL import Image
 import tweepy
 from abc import ABC, abstractmethod
 
+try:
+    import mozjpeg_lossless_optimization
+except ImportError:  # optional: fall back to Pillow's own Huffman optimization
+    mozjpeg_lossless_optimization = None
+
+try:
+    import pyvips
+except (ImportError, OSError):  # optional: the binding needs the libvips shared library
+    pyvips = None
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bible_image_generator.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging; the format uses no thread/process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('bible_image_generator.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+# The file and console writes happen on a listener thread, so a slow disk or terminal
+# never stalls the event loop; the listener is stopped, and the queue drained, at exit
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler only renders the message (and traceback); the real handlers add the timestamp
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 
 # Debug logging for environment variables
-logging.info(f"Raw PRODUCTION value from env: {os.getenv('PRODUCTION')}")
+logging.info("Raw PRODUCTION value from env: %s", os.getenv('PRODUCTION'))
+
+def _backoff(attempt: int, base: Optional[float] = None, cap: float = 30) -> float:
+    """Exponential backoff with full jitter for the given (zero-based) retry attempt."""
+    if base is None:
+        base = Config.RETRY_DELAY
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+class JitteredRetry(Retry):
+    """urllib3 Retry policy sleeping with full-jitter backoff between attempts.
+    
+    A Retry-After header on 413/429/503 responses still takes precedence, capped
+    at RETRY_AFTER_CAP seconds so a worker thread is not parked for minutes.
+    Methods in STATUS_ONLY_METHODS are retried only on a retryable status or a
+    failed connect: after a read timeout or a dropped connection the server may
+    already have done (and billed) the work.
+    """
+    
+    STATUS_ONLY_METHODS = frozenset({'POST'})
+    RETRY_AFTER_CAP = 30
+    
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0
+        return _backoff(len(self.history) - 1)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.RETRY_AFTER_CAP)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if (error is not None and method is not None and method.upper() in self.STATUS_ONLY_METHODS
+                and not self._is_connection_error(error)):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+def _retry_policy() -> JitteredRetry:
+    """Build the adapter retry policy: 429/5xx and connection errors; POST on status only."""
+    return JitteredRetry(
+        total=Config.MAX_RETRIES - 1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+        raise_on_status=False
+    )
+
+# Shared HTTP session so the scrapers, weather API and image downloads reuse pooled connections
+_http_session: Optional[requests.Session] = None
+
+def get_http_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use.
+    
+    Requests are retried by the mounted adapter on connection errors and
+    429/5xx responses, honouring Retry-After; MAX_RETRIES counts attempts,
+    the first one included.
+    """
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        # POST is only used for the Venice.ai calls, which the API rejects as a whole on 429/5xx
+        # and which are therefore safe to repeat on those statuses, never after a read error
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry_policy())
+        _http_session.mount('https://', adapter)
+        _http_session.mount('http://', adapter)
+    return _http_session
+
+def close_http_session() -> None:
+    """Close the shared HTTP session and release its pooled connections."""
+    global _http_session
+    if _http_session is not None:
+        _http_session.close()
+        _http_session = None
+
+# Raw quote pages for the current day as (body, complete), shared by the fetchers and their debug helpers
+_PAGE_CACHE: Dict[tuple, tuple] = {}
+# Both quote sources fetch concurrently from worker threads
+_PAGE_CACHE_LOCK = threading.Lock()
+
+def _get_page(url: str, limit: Optional[int] = None) -> bytes:
+    """Get a page body, downloading it at most once per day.
+    
+    Args:
+        url: Page URL
+        limit: Stop downloading after this many bytes; the quotes sit near the
+            top of the page, so the footers and scripts are usually not needed
+            
+    Returns:
+        bytes: The page body, or a prefix of at least `limit` bytes of it
+        
+    Raises:
+        requests.RequestException: If the download fails
+    """
+    today = datetime.now().strftime('%Y-%m-%d')
+    with _PAGE_CACHE_LOCK:
+        cached = _PAGE_CACHE.get((url, today))
+    if cached is not None and (cached[1] or limit is not None):
+        return cached[0]
+    
+    chunks = []
+    size = 0
+    complete = True
+    with get_http_session().get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(16384):
+            chunks.append(chunk)
+            size += len(chunk)
+            if limit is not None and size >= limit:
+                complete = False  # leaving the rest unread discards the connection
+                break
+    
+    body = b''.join(chunks)
+    with _PAGE_CACHE_LOCK:
+        # Pages from previous days are never read again
+        for cache_key in [k for k in _PAGE_CACHE if k[1] != today]:
+            del _PAGE_CACHE[cache_key]
+        _PAGE_CACHE[(url, today)] = (body, complete)
+    return body
+
+# API clients are created on first use and reused, keeping their connection pools warm
+_groq_client: Optional[AsyncGroq] = None
+_together_client: Optional[Together] = None
+_twitter_clients: Optional[tuple] = None
+_telegram_bot: Optional[Bot] = None
+_telegram_request: Optional[HTTPXRequest] = None
+
+def _get_async_groq() -> AsyncGroq:
+    """Get the shared asynchronous Groq client."""
+    global _groq_client
+    if _groq_client is None:
+        _groq_client = AsyncGroq(api_key=Config.GROQ_API_KEY)
+    return _groq_client
+
+def _get_together() -> Together:
+    """Get the shared Together AI client."""
+    global _together_client
+    if _together_client is None:
+        _together_client = Together(api_key=Config.TOGETHER_API_KEY)
+    return _together_client
+
+def _get_twitter_clients() -> tuple:
+    """Get the shared Twitter clients as (v2 client, v1.1 media API).
+    
+    Both keep their own requests session, so reusing them keeps the TLS
+    connections to api.twitter.com and upload.twitter.com alive between posts.
+    """
+    global _twitter_clients
+    if _twitter_clients is None:
+        client = tweepy.Client(
+            consumer_key=Config.TWITTER_API_KEY,
+            consumer_secret=Config.TWITTER_API_SECRET,
+            access_token=Config.TWITTER_ACCESS_TOKEN,
+            access_token_secret=Config.TWITTER_ACCESS_TOKEN_SECRET
+        )
+        media_client = tweepy.API(tweepy.OAuth1UserHandler(
+            Config.TWITTER_API_KEY,
+            Config.TWITTER_API_SECRET,
+            Config.TWITTER_ACCESS_TOKEN,
+            Config.TWITTER_ACCESS_TOKEN_SECRET
+        ))
+        for session in (client.session, media_client.session):
+            # Retry rate limits and server errors here instead of failing the post outright.
+            # Uploads and tweets are POSTs, so a read timeout or dropped connection is not
+            # retried: the image may already be stored under a media id, or the tweet posted
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=_retry_policy())
+            session.mount('https://', adapter)
+        _twitter_clients = (client, media_client)
+    return _twitter_clients
+
+def _get_telegram_bot() -> Bot:
+    """Get the shared Telegram bot for the configured environment.
+    
+    The bot keeps its httpx connection pool open, so consecutive posts reuse
+    the TLS connection to api.telegram.org.
+    """
+    global _telegram_bot, _telegram_request
+    if _telegram_bot is None:
+        _telegram_request = HTTPXRequest(connection_pool_size=4)
+        _telegram_bot = Bot(token=Config.get_telegram_token(), request=_telegram_request)
+    return _telegram_bot
+
+async def reset_api_clients() -> None:
+    """Close and forget the shared API clients.
+    
+    The next use builds fresh clients, e.g. after rotating API keys. Closing
+    the async Groq client here, inside the running loop, also keeps its
+    connection pool from being torn down after the loop has closed.
+    """
+    global _groq_client, _together_client, _twitter_clients, _telegram_bot, _telegram_request
+    if _groq_client is not None:
+        await _groq_client.close()
+    if _telegram_request is not None:
+        await _telegram_request.shutdown()
+    if _twitter_clients is not None:
+        for client in _twitter_clients:
+            client.session.close()
+    _groq_client = None
+    _together_client = None
+    _twitter_clients = None
+    _telegram_bot = None
+    _telegram_request = None
+
+# On-disk cache for daily responses; the quote and the forecast change at most once a day
+CACHE_DIR = os.path.expanduser(os.getenv('CACHE_DIR', '~/.cache/aipicture'))
+CacheEntry = namedtuple('CacheEntry', 'ts,body')
+# Entries already read or written in this process, so repeated calls skip the disk and unpickling
+_MEMORY_CACHE: Dict[str, CacheEntry] = {}
+
+def _cache_path(key: str) -> str:
+    """Get the cache file path for a cache key."""
+    return os.path.join(CACHE_DIR, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pkl")
+
+def _read_cache(key: str) -> Optional[CacheEntry]:
+    """Read a cache entry from disk, or None if there is no usable entry."""
+    try:
+        with open(_cache_path(key), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning("Could not read cache entry for %s: %s", key, e)
+        return None
+
+def _write_cache(key: str, entry: CacheEntry) -> None:
+    """Write a cache entry to disk atomically."""
+    path = _cache_path(key)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning("Could not write cache entry for %s: %s", key, e)
+
+def ttl_cache(seconds: int, key: Callable[..., str]):
+    """Cache a fetcher's result on disk for the current day.
+    
+    A fresh entry (same day and younger than `seconds`) is returned without
+    calling the fetcher. If the fetcher fails and returns None, an older entry
+    from the same day is returned instead so a temporary outage does not stop
+    the run; an entry from a previous day is never used, because both the
+    daily quote and the forecast change with the date.
+    Entries are also kept in memory, so repeated calls within a run are free.
+    
+    Args:
+        seconds: Maximum age of a fresh cache entry
+        key: Function building the cache key (the URL) from the call arguments
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            entry = _MEMORY_CACHE.get(cache_key)
+            if entry is None:
+                entry = _read_cache(cache_key)
+                if entry is not None:
+                    _MEMORY_CACHE[cache_key] = entry
+            now = datetime.now()
+            if entry and entry.ts.date() == now.date() and now - entry.ts < timedelta(seconds=seconds):
+                logging.info("Using cached response for %s", cache_key)
+                return entry.body
+            
+            body = func(*args, **kwargs)
+            if body is not None:
+                entry = _MEMORY_CACHE[cache_key] = CacheEntry(now, body)
+                _write_cache(cache_key, entry)
+                return body
+            
+            if entry is not None and entry.ts.date() == now.date():
+                logging.warning("Fetching %s failed, using stale cached response from %s", cache_key, entry.ts)
+                return entry.body
+            return None
+        return wrapper
+    return decorator
+
+# Generated prompts are cached as plain text, keyed by day, quote, art style and weather
+PROMPT_CACHE_DIR = os.path.join(CACHE_DIR, 'prompts')
+
+def prompt_cache_key(service: str) -> Callable[..., str]:
+    """Build a cache key function hashing (service, date, quote, art style name, weather context).
+    
+    The prompt mentions the forecast, so a new day or a changed forecast
+    generates a fresh prompt instead of reusing one built for other weather.
+    """
+    def key(quote: str, art_style: dict, weather_context: str = "") -> str:
+        today = datetime.now().strftime('%Y-%m-%d')
+        raw = f"{service}|{today}|{quote}|{art_style['name']}|{weather_context}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    return key
+
+def disk_cache(ttl: int, key: Callable[..., str]):
+    """Cache a coroutine's text result on disk for `ttl` seconds.
+    
+    On a hit the coroutine is not awaited at all, so no API call is made and
+    no rate limit budget is spent. Empty results are not cached. Concurrent
+    calls with the same key share a single in-flight call.
+    
+    Args:
+        ttl: Maximum age of a cache entry in seconds
+        key: Function building the cache file name from the call arguments
+    """
+    def decorator(func):
+        inflight: Dict[str, asyncio.Task] = {}
+        
+        async def compute(path: str, *args, **kwargs):
+            result = await func(*args, **kwargs)
+            if result:
+                try:
+                    os.makedirs(PROMPT_CACHE_DIR, exist_ok=True)
+                    with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+                        f.write(result)
+                    os.replace(f"{path}.tmp", path)
+                except OSError as e:
+                    logging.warning("Could not write prompt cache entry %s: %s", path, e)
+            return result
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            path = os.path.join(PROMPT_CACHE_DIR, f"{key(*args, **kwargs)}.txt")
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path, encoding='utf-8') as f:
+                        logging.info("Using cached prompt from %s", path)
+                        return f.read()
+            except OSError:
+                pass
+            
+            task = inflight.get(path)
+            if task is None:
+                task = asyncio.ensure_future(compute(path, *args, **kwargs))
+                inflight[path] = task
+                task.add_done_callback(lambda _: inflight.pop(path, None))
+            else:
+                logging.info("Waiting for in-flight prompt generation for %s", path)
+            # Shield the shared call so one cancelled caller does not cancel it for the others
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
 
 class QuoteSource(ABC):
     """Abstract base class for quote sources."""
@@ -87,6 +466,29 @@ class Bible21QuoteSource(QuoteSource):
     def __init__(self):
         self.url = Config.BIBLE21_URL
         self.quote_class = Config.BIBLE21_QUOTE_CLASS
+        # Matches the quote span's inner HTML, so the common case needs no DOM at all
+        self._quote_re = re.compile(
+            rb'<span[^>]*class="(?:[^"]*\s)?' + re.escape(self.quote_class.encode('utf-8'))
+            + rb'(?:\s[^"]*)?"[^>]*>(.*?)</span>', re.DOTALL
+        ) if self.quote_class else None
+    
+    def _match_quote(self, page: bytes) -> Optional[str]:
+        """Extract the quote text with the regex fast path.
+        
+        Returns:
+            Optional[str]: The quote text, or None if the page needs a real parse
+        """
+        match = self._quote_re.search(page) if self._quote_re else None
+        # A nested span would end the lazy match early; leave that to the parser
+        if not match or b'<span' in match.group(1):
+            return None
+        try:
+            text = re.sub(rb'<[^>]+>', b'', match.group(1)).decode('utf-8')
+        except UnicodeDecodeError:
+            # Not UTF-8 after all; the parser honours the page's declared encoding
+            return None
+        text = unescape(text).strip()
+        return text or None
     
     def debug_quote_element(self) -> None:
         """
@@ -97,61 +499,62 @@ class Bible21QuoteSource(QuoteSource):
         2. Logs all span elements and their classes
         3. Helps identify the current quote element class when it changes
         """
+        # Everything below is logged at INFO; skip the parse entirely when it would be dropped
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        
         try:
-            response = requests.get(self.url, timeout=10)
-            response.encoding = 'utf-8'
-            response.raise_for_status()
+            soup = bs(_get_page(self.url), 'lxml', from_encoding='utf-8')
             
-            soup = bs(response.text, 'html.parser')
+            # Find the span elements that have a class, in one CSS query
+            spans = soup.select('span[class]')
+            logging.info("Found %s span elements with a class on the page", len(spans))
             
-            # Find all span elements
-            spans = soup.find_all('span')
-            logging.info(f"Found {len(spans)} span elements on the page")
-            
-            # Log each span with its class
-            for span in spans:
-                if span.get('class'):
-                    logging.info(f"Span class: {span.get('class')}")
-                    logging.info(f"Span text: {span.get_text().strip()[:100]}...")
+            # Log all of them as a single record
+            if spans:
+                logging.info("Span classes and texts:\n%s", "\n".join(
+                    f"{span.get('class')}: {span.get_text(strip=True)[:100]}" for span in spans
+                ))
             
             # Try to find the quote using the current class
             quote_element = soup.find('span', attrs={'class': self.quote_class})
             if quote_element:
-                logging.info(f"Quote found with current class '{self.quote_class}': {quote_element.get_text().strip()}")
+                logging.info("Quote found with current class '%s': %s", self.quote_class, quote_element.get_text().strip())
             else:
-                logging.warning(f"Quote NOT found with current class '{self.quote_class}'")
+                logging.warning("Quote NOT found with current class '%s'", self.quote_class)
                 
         except Exception as e:
-            logging.error(f"Error in debug_quote_element: {str(e)}")
+            logging.error("Error in debug_quote_element: %s", e)
     
+    @ttl_cache(seconds=3600, key=lambda self: self.url)
     def fetch_quote(self) -> Optional[str]:
         """Fetch the daily quote from bible21.cz."""
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                response = requests.get(self.url, timeout=10)
-                response.encoding = 'utf-8'
-                response.raise_for_status()
-                
-                soup = bs(response.text, 'html.parser')
-                quote_element = soup.find('span', attrs={'class': self.quote_class})
+        try:
+            # The quote is near the top of the page; only fetch the rest if the regex misses
+            quote_text = self._match_quote(_get_page(self.url, limit=65536))
+            if quote_text:
+                logging.info("Successfully fetched quote from bible21.cz: %.100s...", quote_text)
+                return quote_text
+            
+            page = _get_page(self.url)
+            # Lexbor parses in C and reads the raw bytes as UTF-8 without a decode pass;
+            # BeautifulSoup is only used by debug_quote_element
+            tree = LexborHTMLParser(page)
+            quote_element = tree.css_first(f'span.{self.quote_class}')
+            
+            if quote_element:
+                quote_text = quote_element.text().strip()
+                logging.info("Successfully fetched quote from bible21.cz: %.100s...", quote_text)
+                return quote_text
+            else:
+                logging.warning("Quote element with class '%s' not found on the page", self.quote_class)
+                self.debug_quote_element()
+                return None
                 
-                if quote_element:
-                    quote_text = quote_element.get_text().strip()
-                    logging.info(f"Successfully fetched quote from bible21.cz: {quote_text[:100]}...")
-                    return quote_text
-                else:
-                    logging.warning(f"Quote element with class '{self.quote_class}' not found on the page")
-                    if attempt == Config.MAX_RETRIES - 1:
-                        self.debug_quote_element()
-                    return None
-                    
-            except requests.RequestException as e:
-                logging.error(f"Attempt {attempt + 1} failed: {str(e)}")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY)
-                else:
-                    logging.error("Max retries reached. Could not fetch Bible quote")
-                    return None
+        except requests.RequestException as e:
+            # Transient failures were already retried by the session's adapter
+            logging.error("Could not fetch Bible quote: %s", e)
+            return None
     
     def validate_config(self) -> bool:
         """Validate Bible21 configuration."""
@@ -183,16 +586,12 @@ class DailyVersesQuoteSource(QuoteSource):
         3. Helps identify the current quote element structure
         """
         try:
-            response = requests.get(self.url, timeout=10)
-            response.encoding = 'utf-8'
-            response.raise_for_status()
-            
-            soup = bs(response.text, 'html.parser')
+            soup = bs(_get_page(self.url), 'lxml', from_encoding='utf-8')
             
             # Find all div elements with class b1
             quote_divs = soup.find_all('div', attrs={'class': 'b1'})
             
-            logging.info(f"Found {len(quote_divs)} div elements with class 'b1' on the page")
+            logging.info("Found %s div elements with class 'b1' on the page", len(quote_divs))
             
             # Log each quote div with its content
             for i, div in enumerate(quote_divs):
@@ -200,7 +599,7 @@ class DailyVersesQuoteSource(QuoteSource):
                 quote_span = div.find('span', attrs={'class': 'v1'})
                 if quote_span:
                     quote_text = quote_span.get_text().strip()
-                    logging.info(f"Quote div {i+1}: Text: {quote_text[:100]}...")
+                    logging.info("Quote div %s: Text: %.100s...", i+1, quote_text)
                 
                 # Find the reference div with class vr
                 ref_div = div.find('div', attrs={'class': 'vr'})
@@ -208,59 +607,47 @@ class DailyVersesQuoteSource(QuoteSource):
                     ref_link = ref_div.find('a', attrs={'class': 'vc'})
                     if ref_link:
                         ref_text = ref_link.get_text().strip()
-                        logging.info(f"Quote div {i+1}: Reference: {ref_text}")
+                        logging.info("Quote div %s: Reference: %s", i+1, ref_text)
             
             # Try to find the quote using the current class
             quote_element = soup.find('span', attrs={'class': self.quote_class})
             if quote_element:
-                logging.info(f"Quote found with current class '{self.quote_class}': {quote_element.get_text().strip()}")
+                logging.info("Quote found with current class '%s': %s", self.quote_class, quote_element.get_text().strip())
             else:
-                logging.warning(f"Quote NOT found with current class '{self.quote_class}'")
+                logging.warning("Quote NOT found with current class '%s'", self.quote_class)
                 
         except Exception as e:
-            logging.error(f"Error in debug_quote_element: {str(e)}")
+            logging.error("Error in debug_quote_element: %s", e)
     
+    @ttl_cache(seconds=3600, key=lambda self: self.url)
     def fetch_quote(self) -> Optional[str]:
         """Fetch the daily quote from dailyverses.net."""
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                response = requests.get(self.url, timeout=10)
-                response.encoding = 'utf-8'
-                response.raise_for_status()
+        try:
+            tree = LexborHTMLParser(_get_page(self.url))
+            quote_div = tree.css_first('div.b1')
+            verse_span = quote_div.css_first('span.v1') if quote_div else None
+            
+            if verse_span:
+                verse_text = verse_span.text().strip()
                 
-                soup = bs(response.text, 'html.parser')
-                quote_div = soup.find('div', attrs={'class': 'b1'})
+                # Find the reference link in div.vr
+                ref_link = quote_div.css_first('div.vr a.vc')
+                if ref_link:
+                    ref_text = ref_link.text().strip()
+                    quote_text = f"{verse_text} ({ref_text})"
+                    logging.info("Successfully fetched quote from dailyverses.net: %.100s...", quote_text)
+                    return quote_text
+                logging.info("Successfully fetched quote from dailyverses.net: %.100s...", verse_text)
+                return verse_text
+            else:
+                logging.warning("Quote element not found on the page")
+                self.debug_quote_element()
+                return None
                 
-                if quote_div:
-                    # Find the verse text in span.v1
-                    verse_span = quote_div.find('span', attrs={'class': 'v1'})
-                    if verse_span:
-                        verse_text = verse_span.get_text().strip()
-                        
-                        # Find the reference div with class vr
-                        ref_div = quote_div.find('div', attrs={'class': 'vr'})
-                        if ref_div:
-                            ref_link = ref_div.find('a', attrs={'class': 'vc'})
-                            if ref_link:
-                                ref_text = ref_link.get_text().strip()
-                                quote_text = f"{verse_text} ({ref_text})"
-                                logging.info(f"Successfully fetched quote from dailyverses.net: {quote_text[:100]}...")
-                                return quote_text
-                        logging.info(f"Successfully fetched quote from dailyverses.net: {verse_text[:100]}...")
-                        return verse_text
-                else:
-                    logging.warning("Quote element not found on the page")
-                    if attempt == Config.MAX_RETRIES - 1:
-                        self.debug_quote_element()
-                    return None
-                    
-            except requests.RequestException as e:
-                logging.error(f"Attempt {attempt + 1} failed: {str(e)}")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY)
-                else:
-                    logging.error("Max retries reached. Could not fetch Daily Verses quote")
-                    return None
+        except requests.RequestException as e:
+            # Transient failures were already retried by the session's adapter
+            logging.error("Could not fetch Daily Verses quote: %s", e)
+            return None
     
     def validate_config(self) -> bool:
         """Validate Daily Verses configuration."""
@@ -288,86 +675,201 @@ class QuoteFetcher:
         
         # Validate current source
         if self.current_source not in self.sources:
-            logging.error(f"Invalid quote source: {self.current_source}")
+            logging.error("Invalid quote source: %s", self.current_source)
             self.current_source = 'bible21'  # Default to bible21
             
         # Validate fallback source
         if self.fallback_source not in self.sources:
-            logging.error(f"Invalid fallback source: {self.fallback_source}")
+            logging.error("Invalid fallback source: %s", self.fallback_source)
             self.fallback_source = 'bible21'  # Default to bible21
     
-    def fetch_quote(self) -> Optional[str]:
-        """Fetch a quote from the current source with fallback."""
+    @staticmethod
+    async def _source_result(task: asyncio.Task, source_name: str) -> Optional[str]:
+        """Await one source's fetch, turning its failure into None so the other source still counts."""
         try:
+            return await task
+        except Exception as e:
+            logging.error("Error fetching quote from %s: %s", source_name, e)
+            return None
+    
+    async def fetch_quote(self) -> Optional[str]:
+        """Fetch a quote from the current source with fallback.
+        
+        Both sources are fetched concurrently, so a failing current source no
+        longer adds the fallback's whole latency on top of its own. The current
+        source's quote still wins whenever it succeeds.
+        """
+        fallback = None
+        try:
+            # The scrapers block on HTTP; run each in a worker thread
+            primary = asyncio.create_task(asyncio.to_thread(self.sources[self.current_source].fetch_quote))
+            if self.fallback_source != self.current_source:
+                fallback = asyncio.create_task(asyncio.to_thread(self.sources[self.fallback_source].fetch_quote))
+            
             # Try current source
-            quote = self.sources[self.current_source].fetch_quote()
+            quote = await self._source_result(primary, self.current_source)
             if quote:
-                logging.info(f"Successfully fetched quote from {self.current_source}")
+                logging.info("Successfully fetched quote from %s", self.current_source)
                 return quote
                 
-            # Try fallback source if different from current
-            if self.fallback_source != self.current_source:
-                logging.info(f"Trying fallback source: {self.fallback_source}")
-                quote = self.sources[self.fallback_source].fetch_quote()
+            # Use the fallback source's result, already in flight
+            if fallback is not None:
+                logging.info("Trying fallback source: %s", self.fallback_source)
+                quote = await self._source_result(fallback, self.fallback_source)
                 if quote:
-                    logging.info(f"Successfully fetched quote from fallback source: {self.fallback_source}")
+                    logging.info("Successfully fetched quote from fallback source: %s", self.fallback_source)
                     return quote
                     
             logging.error("Failed to fetch quote from both sources")
             return None
             
         except Exception as e:
-            logging.error(f"Error fetching quote: {str(e)}")
+            logging.error("Error fetching quote: %s", e)
             return None
+        finally:
+            # Stop waiting on an unneeded fallback; its thread finishes (and caches) on its own
+            if fallback is not None and not fallback.done():
+                fallback.cancel()
+
+_TRUTHY = frozenset({'true', '1', 'yes', 'y', 'on', 't'})
+_FALSY = frozenset({'false', '0', 'no', 'n', 'off', 'f'})
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Parse a boolean environment variable; unset or unrecognised values give the default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return default
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Snapshot of the environment-dependent settings, resolved once per load."""
+    
+    production: bool
+    weather_enabled: bool
+    twitter_enabled: bool
+    telegram_token: Optional[str] = field(repr=False)  # Keep the token out of logs
+    telegram_chat_id: Optional[str]
+    ai_service: str
+    image_service: str
+    prompt_length_limit: int
+    prompt_enhancement: bool
+    
+    @classmethod
+    def load(cls) -> 'RuntimeConfig':
+        """Read the current environment into a new snapshot."""
+        production = _env_bool('PRODUCTION', False)
+        return cls(
+            production=production,
+            weather_enabled=_env_bool('WEATHER', True),
+            twitter_enabled=_env_bool('TWITTER', True),
+            telegram_token=os.getenv('TELEGRAM_TOKEN' if production else 'TELEGRAM_TEST_TOKEN'),
+            telegram_chat_id=os.getenv('TELEGRAM_CHAT_ID' if production else 'TELEGRAM_TEST_CHAT_ID'),
+            ai_service=str(os.getenv('AI_SERVICE', 'groq')).strip().lower(),
+            image_service=str(os.getenv('IMAGE_SERVICE', 'together')).strip().lower(),
+            prompt_length_limit=int(os.getenv('PROMPT_LENGTH_LIMIT', '1500')),
+            prompt_enhancement=_env_bool('PROMPT_ENHANCEMENT', True)
+        )
+
+def _dotenv_mtime() -> Optional[float]:
+    """Get the modification time of the .env file, or None if there is none."""
+    path = find_dotenv()
+    try:
+        return os.path.getmtime(path) if path else None
+    except OSError:
+        return None
 
 class Config:
     """Configuration class to store all constants and settings."""
     
+    runtime: RuntimeConfig
+    # .env modification time as of the last load, so a long-running process reloads only on change
+    _env_mtime: Optional[float] = _dotenv_mtime()
+    # Credentials refreshed by reload_env, so rotated keys reach newly built API clients
+    _CREDENTIAL_KEYS = (
+        'TELEGRAM_TOKEN', 'TELEGRAM_TEST_TOKEN', 'TELEGRAM_CHAT_ID', 'TELEGRAM_TEST_CHAT_ID',
+        'TOGETHER_API_KEY', 'GROQ_API_KEY', 'VENICE_API_KEY', 'WEATHER_API_KEY',
+        'TWITTER_API_KEY', 'TWITTER_API_SECRET', 'TWITTER_ACCESS_TOKEN',
+        'TWITTER_ACCESS_TOKEN_SECRET', 'TWITTER_BEARER_TOKEN',
+        'TWITTER_CLIENT_ID', 'TWITTER_CLIENT_SECRET'
+    )
+    
     @classmethod
     def reload_env(cls):
         """Reload environment variables from .env file."""
+        cls._env_mtime = _dotenv_mtime()
         load_dotenv(override=True)
-        logging.info(f"Environment variables reloaded. Raw PRODUCTION value: {os.getenv('PRODUCTION')}")
+        for key in cls._CREDENTIAL_KEYS:
+            setattr(cls, key, os.getenv(key))
+        cls.load_runtime_config()
+        logging.info("Environment variables reloaded. Raw PRODUCTION value: %s", os.getenv('PRODUCTION'))
+    
+    @classmethod
+    def reload_env_if_changed(cls) -> bool:
+        """Reload environment variables only if the .env file changed since the last load.
+        
+        Returns:
+            bool: True if the environment was reloaded
+        """
+        if _dotenv_mtime() == cls._env_mtime:
+            return False
+        cls.reload_env()
+        return True
+    
+    @classmethod
+    def load_runtime_config(cls) -> None:
+        """Snapshot the environment once; reload_env refreshes the snapshot."""
+        cls.runtime = RuntimeConfig.load()
     
     @classmethod
     def is_production(cls) -> bool:
         """Get current production mode status."""
-        return str(os.getenv('PRODUCTION', 'false')).strip().lower() == 'true'
+        return cls.runtime.production
     
     @classmethod
     def is_weather_enabled(cls) -> bool:
         """Get current weather fetching status."""
-        return str(os.getenv('WEATHER', 'true')).strip().lower() not in ('false', '0', 'no', 'n')
+        return cls.runtime.weather_enabled
     
     @classmethod
     def is_twitter_enabled(cls) -> bool:
         """Get current Twitter posting status."""
-        return str(os.getenv('TWITTER', 'true')).strip().lower() not in ('false', '0', 'no', 'n')
+        return cls.runtime.twitter_enabled
     
     @classmethod
     def get_telegram_token(cls) -> Optional[str]:
         """Get appropriate Telegram token based on production mode."""
-        return cls.TELEGRAM_TOKEN if cls.is_production() else cls.TELEGRAM_TEST_TOKEN
+        return cls.runtime.telegram_token
     
     @classmethod
     def get_telegram_chat_id(cls) -> Optional[str]:
         """Get appropriate Telegram chat ID based on production mode."""
-        return cls.TELEGRAM_CHAT_ID if cls.is_production() else cls.TELEGRAM_TEST_CHAT_ID
+        return cls.runtime.telegram_chat_id
     
     @classmethod
     def get_ai_service(cls) -> str:
         """Get the current AI service to use."""
-        return str(os.getenv('AI_SERVICE', 'groq')).strip().lower()
+        return cls.runtime.ai_service
     
     @classmethod
     def get_image_service(cls) -> str:
         """Get the current image generation service to use."""
-        return str(os.getenv('IMAGE_SERVICE', 'together')).strip().lower()
+        return cls.runtime.image_service
     
     @classmethod
     def get_prompt_length_limit(cls) -> int:
         """Get the prompt length limit for Venice.ai."""
-        return int(os.getenv('PROMPT_LENGTH_LIMIT', '1500'))
+        return cls.runtime.prompt_length_limit
+    
+    @classmethod
+    def is_prompt_enhancement_enabled(cls) -> bool:
+        """Get whether image prompts are enhanced by an LLM."""
+        return cls.runtime.prompt_enhancement
     
     # Static configuration values
     BIBLE_URL = os.getenv('BIBLE_URL', 'https://bible21.cz')
@@ -383,6 +885,10 @@ class Config:
     WEATHER_PLACE_ID = os.getenv('WEATHER_PLACE_ID', 'kutna-hora')
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
     RETRY_DELAY = int(os.getenv('RETRY_DELAY', '5'))
+    # Seconds between runs when kept running as a long-lived process; 0 runs once and exits
+    RUN_INTERVAL = int(os.getenv('RUN_INTERVAL', '0'))
+    # Seconds to wait for Venice.ai before racing Together AI against it; 0 disables hedging
+    VENICE_HEDGE_DELAY = float(os.getenv('VENICE_HEDGE_DELAY', '0'))
     
     # Twitter configuration
     TWITTER_API_KEY = os.getenv('TWITTER_API_KEY')
@@ -403,29 +909,48 @@ class Config:
     DAILY_VERSES_URL = 'https://dailyverses.net/cs'    
     DAILY_VERSES_QUOTE_CLASS = 'v1'
     
+    @classmethod
+    def validate_all(cls) -> bool:
+        """Validate the Telegram, Twitter and AI settings, stopping at the first failure.
+        
+        All three read the runtime snapshot and the static settings, so no
+        environment variables are read again here.
+        
+        Returns:
+            bool: True if every section is valid
+        """
+        for name, validate in (('Telegram', cls.validate_telegram_config),
+                               ('Twitter', cls.validate_twitter_config),
+                               ('AI', cls.validate_ai_config)):
+            if not validate():
+                logging.error("Invalid %s configuration. Exiting.", name)
+                return False
+        return True
+    
     @classmethod
     def validate_telegram_config(cls) -> bool:
         """Validate Telegram configuration settings."""
-        if cls.is_production():
-            if not cls.TELEGRAM_TOKEN:
+        runtime = cls.runtime
+        if runtime.production:
+            if not runtime.telegram_token:
                 logging.error("TELEGRAM_TOKEN is not set for production mode")
                 return False
-            if not cls.TELEGRAM_CHAT_ID:
+            if not runtime.telegram_chat_id:
                 logging.error("TELEGRAM_CHAT_ID is not set for production mode")
                 return False
         else:
-            if not cls.TELEGRAM_TEST_TOKEN:
+            if not runtime.telegram_token:
                 logging.error("TELEGRAM_TEST_TOKEN is not set for test mode")
                 return False
-            if not cls.TELEGRAM_TEST_CHAT_ID:
+            if not runtime.telegram_chat_id:
                 logging.error("TELEGRAM_TEST_CHAT_ID is not set for test mode")
                 return False
             
-        logging.info(f"Telegram configuration validated. Production mode: {cls.is_production()}")
-        if cls.is_production():
-            logging.info(f"Using production token and chat ID: {cls.TELEGRAM_CHAT_ID}")
+        logging.info("Telegram configuration validated. Production mode: %s", runtime.production)
+        if runtime.production:
+            logging.info("Using production token and chat ID: %s", runtime.telegram_chat_id)
         else:
-            logging.info(f"Using test token and chat ID: {cls.TELEGRAM_TEST_CHAT_ID}")
+            logging.info("Using test token and chat ID: %s", runtime.telegram_chat_id)
         return True
 
     @classmethod
@@ -445,7 +970,7 @@ class Config:
         
         for key in required_keys:
             if not getattr(cls, key):
-                logging.error(f"{key} is not set")
+                logging.error("%s is not set", key)
                 return False
                 
         logging.info("Twitter configuration validated")
@@ -467,7 +992,7 @@ class Config:
                 logging.error("VENICE_API_KEY is not set")
                 return False
         else:
-            logging.error(f"Invalid AI service: {ai_service}")
+            logging.error("Invalid AI service: %s", ai_service)
             return False
         
         # Validate image generation service
@@ -480,17 +1005,20 @@ class Config:
                 logging.error("VENICE_API_KEY is not set for image generation")
                 return False
         else:
-            logging.error(f"Invalid image service: {image_service}")
+            logging.error("Invalid image service: %s", image_service)
             return False
             
         # Validate prompt length limit configuration
         prompt_limit = cls.get_prompt_length_limit()
         if prompt_limit <= 0 or prompt_limit > 2000:
-            logging.warning(f"PROMPT_LENGTH_LIMIT ({prompt_limit}) seems unusual. Expected value is 1500 for Venice.ai")
+            logging.warning("PROMPT_LENGTH_LIMIT (%s) seems unusual. Expected value is 1500 for Venice.ai", prompt_limit)
         
-        logging.info(f"AI configuration validated. Using AI service: {ai_service}, Image service: {image_service}")
+        logging.info("AI configuration validated. Using AI service: %s, Image service: %s", ai_service, image_service)
         return True
 
+# Prime the runtime snapshot so it is available before the first reload_env
+Config.load_runtime_config()
+
 # Dictionary of modern art styles for image generation
 IMAGE_ART = {
     'impressionism': {
@@ -575,6 +1103,11 @@ IMAGE_ART = {
     
 }
 
+# The styles are static, so store each name and join the characteristics once for prompt building
+for _name, _style in IMAGE_ART.items():
+    _style['name'] = _name
+    _style['characteristics_str'] = ', '.join(_style['characteristics'])
+
 class WeightedStyleSelector:
     """Class to handle weighted random selection of art styles."""
     
@@ -585,8 +1118,11 @@ class WeightedStyleSelector:
             styles: Dictionary of art styles with their weights
         """
         self.styles = styles
-        self.total_weight = sum(style['weight'] for style in styles.values())
-        logging.info(f"Initialized WeightedStyleSelector with total weight: {self.total_weight}")
+        # Precompute (name, style) pairs and cumulative weights once; random.choices bisects them in C
+        self._entries = list(styles.items())
+        self._cum_weights = list(itertools.accumulate(style['weight'] for style in styles.values()))
+        self.total_weight = self._cum_weights[-1] if self._cum_weights else 0
+        logging.info("Initialized WeightedStyleSelector with total weight: %s", self.total_weight)
         
     def select_style(self) -> tuple[str, dict]:
         """Select a random style based on weights.
@@ -597,19 +1133,12 @@ class WeightedStyleSelector:
         if not self.styles:
             raise ValueError("No styles available for selection")
             
-        r = random.uniform(0, self.total_weight)
-        current = 0
-        
-        for style_name, style in self.styles.items():
-            current += style['weight']
-            if r <= current:
-                logging.info(f"Selected style '{style_name}' with weight {style['weight']}")
-                return style_name, style
-                
-        # Fallback to last style if something goes wrong
-        last_style = list(self.styles.items())[-1]
-        logging.warning(f"Falling back to last style: {last_style[0]}")
-        return last_style
+        style_name, style = random.choices(self._entries, cum_weights=self._cum_weights, k=1)[0]
+        logging.info("Selected style '%s' with weight %s", style_name, style['weight'])
+        return style_name, style
+
+# IMAGE_ART is static, so a single selector serves every prompt generator
+_STYLE_SELECTOR = WeightedStyleSelector(IMAGE_ART)
 
 class WeatherIconMapper:
     """Class to map Meteosource weather codes to emoji icons."""
@@ -665,6 +1194,8 @@ class WeatherIconMapper:
         'default': '❓'
     }
     
+    DEFAULT_ICON = WEATHER_ICONS['default']
+    
     @classmethod
     def get_icon(cls, weather_code: str) -> str:
         """Get the appropriate emoji icon for a given weather code.
@@ -675,117 +1206,104 @@ class WeatherIconMapper:
         Returns:
             str: The corresponding emoji icon, or default icon if code not found
         """
-        # Try to find exact match first
-        if weather_code in cls.WEATHER_ICONS:
-            return cls.WEATHER_ICONS[weather_code]
-                
-        # Return default icon if no match found
-        logging.warning(f"No weather icon found for code: {weather_code}, using default")
-        return cls.WEATHER_ICONS['default']
+        icon = cls.WEATHER_ICONS.get(weather_code)
+        if icon is None:
+            logging.warning("No weather icon found for code: %s, using default", weather_code)
+            return cls.DEFAULT_ICON
+        return icon
 
 class WeatherAPI:
     """Class to handle weather data fetching from Meteosource API."""
     
+    API_URL = "https://www.meteosource.com/api/v1/free/point"
+    
     @staticmethod
     def fetch_weather() -> Optional[dict]:
         """Fetch current weather data for the specified location."""
         if not Config.is_weather_enabled():
             logging.info("Weather fetching is disabled")
             return None
+        
+        return WeatherAPI._fetch_weather_data()
+    
+    @staticmethod
+    @ttl_cache(seconds=3600, key=lambda: f"{WeatherAPI.API_URL}?place_id={Config.WEATHER_PLACE_ID}")
+    def _fetch_weather_data() -> Optional[dict]:
+        """Fetch the daily forecast from Meteosource, cached on disk."""
+        try:
+            url = WeatherAPI.API_URL
+            parameters = {
+                'key': Config.WEATHER_API_KEY,
+                'place_id': Config.WEATHER_PLACE_ID,
+                'sections': 'daily',
+                'timezone': 'UTC',
+                'language': 'en',
+                'units': 'metric'
+            }
             
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                url = "https://www.meteosource.com/api/v1/free/point"
-                parameters = {
-                    'key': Config.WEATHER_API_KEY,
-                    'place_id': Config.WEATHER_PLACE_ID,
-                    'sections': 'daily',
-                    'timezone': 'UTC',
-                    'language': 'en',
-                    'units': 'metric'
-                }
-                
-                response = requests.get(url, params=parameters, timeout=10)
-                response.raise_for_status()
+            response = get_http_session().get(url, params=parameters, timeout=10)
+            response.raise_for_status()
+            
+            # orjson decodes the raw bytes in native code, far faster than the stdlib json module
+            data = orjson.loads(response.content)
+            if 'daily' in data and 'data' in data['daily']:
+                logging.info("Successfully fetched weather data for %s", Config.WEATHER_PLACE_ID)
+                # Only today's record is ever used; keep the cached and in-memory data small
+                return {'daily': {'data': data['daily']['data'][:1]}}
+            else:
+                logging.warning("Weather data not found in response")
+                return None
                 
-                data = response.json()
-                if 'daily' in data and 'data' in data['daily']:
-                    logging.info(f"Successfully fetched weather data for {Config.WEATHER_PLACE_ID}")
-                    return data
-                else:
-                    logging.warning("Weather data not found in response")
-                    return None
-                    
-            except requests.RequestException as e:
-                logging.error(f"Weather API attempt {attempt + 1} failed: {str(e)}")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY)
-                else:
-                    logging.error("Max retries reached. Could not fetch weather data")
-                    return None
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            # Transient failures were already retried by the session's adapter
+            logging.error("Could not fetch weather data: %s", e)
+            return None
 
     @staticmethod
-    def get_weather_icon(weather_data: dict) -> str:
-        """Get the weather icon for the current conditions.
+    def extract_all(weather_data: dict) -> tuple:
+        """Extract the prompt context and the caption icon in one pass.
         
         Args:
             weather_data: The weather data dictionary from Meteosource API
             
         Returns:
-            str: The weather icon emoji
+            tuple: (prompt context, caption icon), both empty strings if no data
         """
         if not weather_data or 'daily' not in weather_data or 'data' not in weather_data['daily']:
-            return WeatherIconMapper.get_icon('default')
+            return "", ""
             
         try:
-            daily_data = weather_data['daily']['data'][0]
+            # Resolve each nested level once; `or {}` also covers sections sent as null
+            daily_data = weather_data['daily']['data'][0]  # Get first day's data
             weather_code = daily_data.get('weather', '')
-            return WeatherIconMapper.get_icon(weather_code)
+            icon = WeatherIconMapper.get_icon(weather_code)
+            all_day = daily_data.get('all_day') or {}
+            wind_data = all_day.get('wind') or {}
+            cloud_data = all_day.get('cloud_cover', '')
+            cloud_cover = cloud_data.get('total', '') if isinstance(cloud_data, dict) else cloud_data
         except Exception as e:
-            logging.error(f"Error getting weather icon: {str(e)}")
-            return WeatherIconMapper.get_icon('default')
+            logging.error("Error reading weather data: %s", e)
+            return "", WeatherIconMapper.DEFAULT_ICON
+        
+        try:
+            weather_context = _weather_context(
+                weather_code, daily_data.get('summary', ''),
+                all_day.get('temperature', ''), all_day.get('temperature_min', ''),
+                all_day.get('temperature_max', ''), wind_data.get('speed', ''),
+                wind_data.get('dir', ''), cloud_cover
+            )
+        except Exception as e:
+            logging.error("Error formatting weather data: %s", e)
+            weather_context = ""
+        return weather_context, icon
 
     @staticmethod
     def format_weather_for_prompt(weather_data: dict) -> str:
         """Format weather data into a prompt-friendly string."""
-        if not weather_data or 'daily' not in weather_data or 'data' not in weather_data['daily']:
-            return ""
-            
-        try:
-            daily_data = weather_data['daily']['data'][0]  # Get first day's data
-            
-            # Extract weather information
-            weather_desc = daily_data.get('weather', '')
-            summary = daily_data.get('summary', '')
-            
-            # Extract temperature information
-            temp_data = daily_data.get('all_day', {})
-            temp = temp_data.get('temperature', '')
-            temp_min = temp_data.get('temperature_min', '')
-            temp_max = temp_data.get('temperature_max', '')
-            
-            # Extract wind information
-            wind_data = temp_data.get('wind', {})
-            wind_speed = wind_data.get('speed', '')
-            wind_dir = wind_data.get('dir', '')
-            
-            # Extract cloud cover
-            cloud_data = temp_data.get('cloud_cover', {})
-            cloud_cover = cloud_data.get('total', '') if isinstance(cloud_data, dict) else cloud_data
-            
-            weather_context = (
-                f"Daily weather forecast: {weather_desc}, {summary}\n"
-                f"Temperature: {temp}°C (min: {temp_min}°C, max: {temp_max}°C)\n"
-                f"Wind: {wind_speed} m/s from {wind_dir}\n"
-                f"Cloud cover: {cloud_cover}%"
-            )
-            
-            logging.info(f"Formatted weather context: {weather_context}")
-            return weather_context
-            
-        except Exception as e:
-            logging.error(f"Error formatting weather data: {str(e)}")
-            return ""
+        weather_context = WeatherAPI.extract_all(weather_data)[0]
+        if weather_context:
+            logging.info("Formatted weather context: %s", weather_context)
+        return weather_context
 
     @staticmethod
     def format_weather_for_caption(weather_data: dict) -> str:
@@ -797,53 +1315,150 @@ class WeatherAPI:
         Returns:
             str: Weather icon emoji, or empty string if no data
         """
-        if not weather_data or 'daily' not in weather_data or 'data' not in weather_data['daily']:
-            return ""
-            
-        try:
-            weather_icon = WeatherAPI.get_weather_icon(weather_data)
-            return weather_icon
-            
-        except Exception as e:
-            logging.error(f"Error formatting weather for caption: {str(e)}")
-            return ""
+        return WeatherAPI.extract_all(weather_data)[1]
 
-class GroqPromptGenerator:
-    """Class to handle prompt generation using Groq AI."""
+@lru_cache(maxsize=4)
+def _weather_context(weather: str, summary: str, temperature, temperature_min,
+                     temperature_max, wind_speed, wind_dir, cloud_cover) -> str:
+    """Build the prompt weather context; the same forecast is formatted once per day."""
+    return (
+        f"Daily weather forecast: {weather}, {summary}\n"
+        f"Temperature: {temperature}°C "
+        f"(min: {temperature_min}°C, max: {temperature_max}°C)\n"
+        f"Wind: {wind_speed} m/s from {wind_dir}\n"
+        f"Cloud cover: {cloud_cover}%"
+    )
+
+class AsyncTokenBucket:
+    """Token bucket limiting requests per minute and, optionally, tokens per minute.
+    
+    Callers reserve capacity up front and then wait out any deficit, so
+    concurrent callers queue up behind each other instead of all firing at
+    once and hitting HTTP 429.
+    """
     
-    _instance = None
+    def __init__(self, rpm: int, tpm: Optional[int] = None):
+        """Initialize the bucket full.
+        
+        Args:
+            rpm: Allowed requests per minute
+            tpm: Allowed tokens per minute, or None to limit requests only
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm or 0)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
     
-    def __new__(cls):
-        """Singleton pattern to ensure only one instance exists."""
-        if cls._instance is None:
-            cls._instance = super(GroqPromptGenerator, cls).__new__(cls)
-            cls._instance.style_selector = WeightedStyleSelector(IMAGE_ART)
-        return cls._instance
+    def _refill(self) -> None:
+        """Add the capacity accumulated since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60)
     
-    @classmethod
-    def get_random_art_style(cls) -> dict:
+    def _reserve(self, cost: int) -> float:
+        """Take one request and `cost` tokens from the bucket.
+        
+        Returns:
+            float: Seconds to wait until the reservation is covered
+        """
+        with self._lock:
+            self._refill()
+            self.requests -= 1
+            delay = max(0.0, -self.requests) * 60 / self.rpm
+            if self.tpm:
+                self.tokens -= cost
+                delay = max(delay, max(0.0, -self.tokens) * 60 / self.tpm)
+            return delay
+    
+    async def acquire(self, cost: int = 0) -> None:
+        """Wait until one request costing `cost` tokens is allowed."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            logging.info("Rate limiter waiting %.1fs before next request", delay)
+            await asyncio.sleep(delay)
+    
+    def acquire_blocking(self, cost: int = 0) -> None:
+        """Blocking variant of acquire for synchronous API clients."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            logging.info("Rate limiter waiting %.1fs before next request", delay)
+            time.sleep(delay)
+    
+    def rebate(self, tokens: int) -> None:
+        """Return unused tokens to the bucket (negative values charge extra)."""
+        if not self.tpm:
+            return
+        with self._lock:
+            self.tokens = min(self.tpm, self.tokens + tokens)
+
+# Shared limiters matching the free-tier limits of each API
+GROQ_LIMITER = AsyncTokenBucket(rpm=30, tpm=6000)
+TOGETHER_LIMITER = AsyncTokenBucket(rpm=10)
+TELEGRAM_LIMITER = AsyncTokenBucket(rpm=20)
+
+_SYSTEM_PROMPT_TEMPLATE = """You want to create witty image generation prompts. Your task is to analyze Bible quotes and create prompts that will generate meaningful, symbolic, and visually striking images in {style_name} style with these characteristics: {characteristics}. Make sure that the prompt respects painting techniques of given art style."""
+
+@lru_cache(maxsize=32)
+def _system_prompt(style_name: str) -> str:
+    """Build the prompt generators' system prompt for an art style; there are only a handful of styles."""
+    return _SYSTEM_PROMPT_TEMPLATE.format(
+        style_name=style_name, characteristics=IMAGE_ART[style_name]['characteristics_str']
+    )
+
+_BASIC_PROMPT_TEMPLATE = """Create a symbolic and meaningful image representing this Bible quote: "{quote}"
+            The image should:
+            1. Capture the essence and meaning of the quote
+            2. Use symbolic elements and metaphors
+            3. Have a spiritual and contemplative atmosphere
+            4. Be suitable for sharing on social media
+            5. Use {style_name} style with these characteristics: {characteristics}"""
+
+@lru_cache(maxsize=32)
+def _basic_prompt(quote: str, style_name: str) -> str:
+    """Build the template image prompt used without (or instead of) an LLM."""
+    return _BASIC_PROMPT_TEMPLATE.format(
+        quote=quote, style_name=style_name, characteristics=IMAGE_ART[style_name]['characteristics_str']
+    )
+
+class PromptGenerator(ABC):
+    """Abstract base class for prompt generators.
+    
+    Style selection and the system prompt are the same for every service and
+    share the module-level selector, so subclasses only implement the LLM call.
+    """
+    
+    @staticmethod
+    def get_random_art_style() -> dict:
         """Get a random art style using weighted selection."""
-        if cls._instance is None:
-            cls._instance = cls()
-        style_name, style = cls._instance.style_selector.select_style()
-        style['name'] = style_name
-        logging.info(f"Selected art style: {style_name} - {style['description']}")
+        style_name, style = _STYLE_SELECTOR.select_style()
+        logging.info("Selected art style: %s - %s", style_name, style['description'])
         return style
     
     @staticmethod
     def create_system_prompt(art_style: dict) -> str:
-        """Create the system prompt for Groq AI."""
-        return f"""You want to create witty image generation prompts. Your task is to analyze Bible quotes and create prompts that will generate meaningful, symbolic, and visually striking images in {art_style['name']} style with these characteristics: {', '.join(art_style['characteristics'])}. Make sure that the prompt respects painting techniques of given art style."""
+        """Create the system prompt for an art style."""
+        return _system_prompt(art_style['name'])
+    
+    @staticmethod
+    @abstractmethod
+    async def generate_enhanced_prompt(quote: str, art_style: dict, weather_context: str = "") -> Optional[str]:
+        """Generate an enhanced image prompt for the quote."""
+        pass
 
+class GroqPromptGenerator(PromptGenerator):
+    """Class to handle prompt generation using Groq AI."""
+    
     @staticmethod
-    def generate_enhanced_prompt(quote: str, art_style: dict) -> Optional[str]:
+    @disk_cache(ttl=86400, key=prompt_cache_key('groq'))
+    async def generate_enhanced_prompt(quote: str, art_style: dict, weather_context: str = "") -> Optional[str]:
         """Generate an enhanced prompt using Groq AI."""
         try:
-            # Fetch weather data
-            weather_data = WeatherAPI.fetch_weather()
-            weather_context = WeatherAPI.format_weather_for_prompt(weather_data)
-            
-            client = Groq(api_key=Config.GROQ_API_KEY)
+            client = _get_async_groq()
             system_prompt = GroqPromptGenerator.create_system_prompt(art_style)
             
             user_prompt = f"""Create a detailed image generation prompt for this Bible quote, but do not use the quote itself in the description of the image: {quote}       
@@ -856,7 +1471,12 @@ class GroqPromptGenerator:
             if weather_context:
                 user_prompt += f"\n\nConsider this weather context for the mood of the image: {weather_context}"
             
-            response = client.chat.completions.create(
+            # Rough estimate (~4 characters per token) plus the completion budget
+            max_tokens = 500
+            estimated_tokens = (len(system_prompt) + len(user_prompt)) // 4 + max_tokens
+            await GROQ_LIMITER.acquire(estimated_tokens)
+            
+            response = await client.chat.completions.create(
                 messages=[
                     {
                         "role": "system",
@@ -869,52 +1489,29 @@ class GroqPromptGenerator:
                 ],
                 model="moonshotai/kimi-k2-instruct",
                 temperature=0.9,
-                max_tokens=500
+                max_tokens=max_tokens
             )
             
+            # Settle the estimate against the actual usage
+            if response.usage:
+                GROQ_LIMITER.rebate(estimated_tokens - response.usage.total_tokens)
+            
             enhanced_prompt = response.choices[0].message.content
             logging.info("Successfully generated enhanced prompt using GROQ")
             return enhanced_prompt
             
         except Exception as e:
-            logging.error(f"Error generating enhanced prompt: {str(e)}")
+            logging.error("Error generating enhanced prompt: %s", e)
             return None
 
-class VenicePromptGenerator:
+class VenicePromptGenerator(PromptGenerator):
     """Class to handle prompt generation using Venice.ai."""
     
-    _instance = None
-    
-    def __new__(cls):
-        """Singleton pattern to ensure only one instance exists."""
-        if cls._instance is None:
-            cls._instance = super(VenicePromptGenerator, cls).__new__(cls)
-            cls._instance.style_selector = WeightedStyleSelector(IMAGE_ART)
-        return cls._instance
-    
-    @classmethod
-    def get_random_art_style(cls) -> dict:
-        """Get a random art style using weighted selection."""
-        if cls._instance is None:
-            cls._instance = cls()
-        style_name, style = cls._instance.style_selector.select_style()
-        style['name'] = style_name
-        logging.info(f"Selected art style: {style_name} - {style['description']}")
-        return style
-    
     @staticmethod
-    def create_system_prompt(art_style: dict) -> str:
-        """Create the system prompt for Venice.ai."""
-        return f"""You want to create witty image generation prompts. Your task is to analyze Bible quotes and create prompts that will generate meaningful, symbolic, and visually striking images in {art_style['name']} style with these characteristics: {', '.join(art_style['characteristics'])}. Make sure that the prompt respects painting techniques of given art style."""
-
-    @staticmethod
-    def generate_enhanced_prompt(quote: str, art_style: dict) -> Optional[str]:
+    @disk_cache(ttl=86400, key=prompt_cache_key('venice'))
+    async def generate_enhanced_prompt(quote: str, art_style: dict, weather_context: str = "") -> Optional[str]:
         """Generate an enhanced prompt using Venice.ai."""
         try:
-            # Fetch weather data
-            weather_data = WeatherAPI.fetch_weather()
-            weather_context = WeatherAPI.format_weather_for_prompt(weather_data)
-            
             headers = {
                 'Authorization': f'Bearer {Config.VENICE_API_KEY}',
                 'Content-Type': 'application/json'
@@ -949,52 +1546,39 @@ class VenicePromptGenerator:
                 'presence_penalty': 0
             }
             
-            for attempt in range(Config.MAX_RETRIES):
-                try:
-                    response = requests.post(
-                        'https://api.venice.ai/api/v1/chat/completions',
-                        headers=headers,
-                        json=data,
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 429:
-                        logging.warning(f"Rate limit hit on attempt {attempt + 1}, retrying after delay")
-                        time.sleep(Config.RETRY_DELAY)
-                        continue
-                        
-                    response.raise_for_status()
-                    result = response.json()
-                    
-                    enhanced_prompt = result['choices'][0]['message']['content']
-                    
-                    # Validate and optimize prompt length for Venice.ai
-                    optimized_prompt, was_truncated = PromptLengthValidator.optimize_prompt(enhanced_prompt)
-                    
-                    if was_truncated:
-                        logging.warning("Generated prompt was truncated to fit Venice.ai character limit")
-                        stats = PromptLengthValidator.get_prompt_statistics(enhanced_prompt)
-                        logging.info(f"Prompt statistics: {stats}")
-                    
-                    logging.info(f"Successfully generated enhanced prompt using VENICE (length: {len(optimized_prompt)} chars)")
-                    return optimized_prompt
-                    
-                except requests.exceptions.RequestException as e:
-                    if attempt < Config.MAX_RETRIES - 1:
-                        logging.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                        time.sleep(Config.RETRY_DELAY)
-                    else:
-                        raise
-                        
+            # Rate limits and transient failures are retried by the shared session's adapter
+            response = await asyncio.to_thread(
+                get_http_session().post,
+                'https://api.venice.ai/api/v1/chat/completions',
+                headers=headers,
+                data=orjson.dumps(data),
+                timeout=30
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            
+            enhanced_prompt = result['choices'][0]['message']['content']
+            
+            # Validate and optimize prompt length for Venice.ai
+            optimized_prompt, was_truncated = PromptLengthValidator.optimize_prompt(enhanced_prompt)
+            
+            if was_truncated:
+                logging.warning("Generated prompt was truncated to fit Venice.ai character limit")
+                stats = PromptLengthValidator.get_prompt_statistics(enhanced_prompt)
+                logging.info("Prompt statistics: %s", stats)
+            
+            logging.info("Successfully generated enhanced prompt using VENICE (length: %s chars)", len(optimized_prompt))
+            return optimized_prompt
+            
         except Exception as e:
-            logging.error(f"Error generating enhanced prompt: {str(e)}")
+            logging.error("Error generating enhanced prompt: %s", e)
             return None
 
 class PromptGeneratorFactory:
     """Factory class to create appropriate prompt generator based on configuration."""
     
     @staticmethod
-    def get_prompt_generator() -> Union[GroqPromptGenerator, VenicePromptGenerator]:
+    def get_prompt_generator() -> PromptGenerator:
         """Get the appropriate prompt generator based on configuration."""
         service = Config.get_ai_service()
         
@@ -1006,35 +1590,55 @@ class PromptGeneratorFactory:
             
         return GroqPromptGenerator()
 
+async def _create_image_prompt(quote: str, art_style: dict, weather_data: Optional[dict] = None) -> str:
+    """Build the image prompt shared by both image services.
+    
+    Uses the configured prompt generator when enhancement is enabled and
+    falls back to the basic template when it is disabled or fails.
+    """
+    if not Config.is_prompt_enhancement_enabled():
+        logging.info("Prompt enhancement is disabled, using basic prompt")
+        return _basic_prompt(quote, art_style['name'])
+    
+    # Format the forecast once; the generator and its cache key both use the result
+    weather_context = WeatherAPI.format_weather_for_prompt(weather_data)
+    prompt_generator = PromptGeneratorFactory.get_prompt_generator()
+    enhanced_prompt = await prompt_generator.generate_enhanced_prompt(quote, art_style, weather_context)
+    
+    if not enhanced_prompt:
+        logging.warning("Falling back to basic prompt generation")
+        enhanced_prompt = _basic_prompt(quote, art_style['name'])
+    
+    return enhanced_prompt
+
 class ImageGenerator:
     """Class to handle image generation using Together AI."""
     
     @staticmethod
-    def create_prompt(quote: str, art_style: dict) -> str:
+    async def create_prompt(quote: str, art_style: dict, weather_data: Optional[dict] = None) -> str:
         """Create a prompt for image generation based on the Bible quote."""
-        prompt_generator = PromptGeneratorFactory.get_prompt_generator()
-        enhanced_prompt = prompt_generator.generate_enhanced_prompt(quote, art_style)
-        
-        if not enhanced_prompt:
-            logging.warning("Falling back to basic prompt generation")
-            enhanced_prompt = f"""Create a symbolic and meaningful image representing this Bible quote: "{quote}"
-            The image should:
-            1. Capture the essence and meaning of the quote
-            2. Use symbolic elements and metaphors
-            3. Have a spiritual and contemplative atmosphere
-            4. Be suitable for sharing on social media
-            5. Use {art_style['name']} style with these characteristics: {', '.join(art_style['characteristics'])}"""
-        
-        return enhanced_prompt
+        return await _create_image_prompt(quote, art_style, weather_data)
 
     @staticmethod
-    def generate_image(quote: str, art_style: dict) -> Optional[bytes]:
+    async def generate_image(quote: str, art_style: dict, weather_data: Optional[dict] = None) -> Optional[io.BytesIO]:
         """Generate image using Together AI API."""
         try:
-            client = Together(api_key=Config.TOGETHER_API_KEY)
-            prompt = ImageGenerator.create_prompt(quote, art_style)
-            logging.info(f"Generating image with prompt: {prompt}")
+            prompt = await ImageGenerator.create_prompt(quote, art_style, weather_data)
+            logging.info("Generating image with prompt: %s", prompt)
             
+            # The Together client is synchronous; keep it off the event loop
+            return await asyncio.to_thread(ImageGenerator._render_image, prompt)
+                
+        except Exception as e:
+            logging.error("Error generating image: %s", e)
+            return None
+    
+    @staticmethod
+    def _render_image(prompt: str) -> Optional[io.BytesIO]:
+        """Render the prompt with Together AI and download the resulting image."""
+        try:
+            client = _get_together()
+            TOGETHER_LIMITER.acquire_blocking()
             response = client.images.generate(
                 model="black-forest-labs/FLUX.1-schnell",
                 #model="black-forest-labs/FLUX.1-schnell-Free",
@@ -1054,43 +1658,36 @@ class ImageGenerator:
                 return None
                 
             try:
-                image_response = requests.get(image_url)
-                image_response.raise_for_status()
-                return image_response.content
+                # Stream the download into a single in-memory buffer
+                with get_http_session().get(image_url, stream=True) as image_response:
+                    image_response.raise_for_status()
+                    image = io.BytesIO()
+                    for chunk in image_response.iter_content(chunk_size=65536):
+                        image.write(chunk)
+                image.seek(0)
+                return image
             except Exception as e:
-                logging.error(f"Error downloading image from URL: {str(e)}")
+                logging.error("Error downloading image from URL: %s", e)
                 return None
                 
         except Exception as e:
-            logging.error(f"Error generating image: {str(e)}")
+            logging.error("Error generating image: %s", e)
             return None
 
 class VeniceImageGenerator:
     """Class to handle image generation using Venice.ai."""
     
     @staticmethod
-    def create_prompt(quote: str, art_style: dict) -> str:
+    async def create_prompt(quote: str, art_style: dict, weather_data: Optional[dict] = None) -> str:
         """Create a prompt for image generation based on the Bible quote."""
-        prompt_generator = PromptGeneratorFactory.get_prompt_generator()
-        enhanced_prompt = prompt_generator.generate_enhanced_prompt(quote, art_style)
-        
-        if not enhanced_prompt:
-            logging.warning("Falling back to basic prompt generation")
-            enhanced_prompt = f"""Create a symbolic and meaningful image representing this Bible quote: "{quote}"
-            The image should:
-            1. Capture the essence and meaning of the quote
-            2. Use symbolic elements and metaphors
-            3. Have a spiritual and contemplative atmosphere
-            4. Be suitable for sharing on social media
-            5. Use {art_style['name']} style with these characteristics: {', '.join(art_style['characteristics'])}"""
-        
-        return enhanced_prompt
+        return await _create_image_prompt(quote, art_style, weather_data)
 
     @staticmethod
-    def generate_image(quote: str, art_style: dict) -> Optional[bytes]:
+    async def generate_image(quote: str, art_style: dict, weather_data: Optional[dict] = None) -> Optional[io.BytesIO]:
         """Generate image using Venice.ai API."""
+        prompt = None
         try:
-            prompt = VeniceImageGenerator.create_prompt(quote, art_style)
+            prompt = await VeniceImageGenerator.create_prompt(quote, art_style, weather_data)
             
             # Validate and optimize prompt length for Venice.ai image generation
             optimized_prompt, was_truncated = PromptLengthValidator.optimize_prompt(prompt)
@@ -1098,72 +1695,19 @@ class VeniceImageGenerator:
             if was_truncated:
                 logging.warning("Image generation prompt was truncated to fit Venice.ai character limit")
                 stats = PromptLengthValidator.get_prompt_statistics(prompt)
-                logging.info(f"Image prompt statistics: {stats}")
+                logging.info("Image prompt statistics: %s", stats)
             
-            logging.info(f"Generating image with Venice.ai using prompt (length: {len(optimized_prompt)} chars): {optimized_prompt}")
+            logging.info("Generating image with Venice.ai using prompt (length: %s chars): %s", len(optimized_prompt), optimized_prompt)
             
-            headers = {
-                'Authorization': f'Bearer {Config.VENICE_API_KEY}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Venice.ai image generation parameters based on API docs
-            data = {
-                'model': 'hidream',
-                'prompt': optimized_prompt,
-                'size': '1024x1024',
-                'response_format': 'b64_json',
-                'output_format': 'png',
-                'quality': 'auto',
-                'style': 'natural',
-                'n': 1,
-                'background': 'auto',
-                'moderation': 'auto',
-                'output_compression': 100
-            }
+            venice = asyncio.create_task(VeniceImageGenerator._request_image(optimized_prompt))
+            if Config.VENICE_HEDGE_DELAY > 0:
+                done, _ = await asyncio.wait({venice}, timeout=Config.VENICE_HEDGE_DELAY)
+                if not done:
+                    return await VeniceImageGenerator._hedge_with_together(venice, prompt)
+            return await venice
             
-            for attempt in range(Config.MAX_RETRIES):
-                try:
-                    response = requests.post(
-                        'https://api.venice.ai/api/v1/images/generations',
-                        headers=headers,
-                        json=data,
-                        timeout=60  # Longer timeout for image generation
-                    )
-                    
-                    if response.status_code == 429:
-                        logging.warning(f"Rate limit hit on attempt {attempt + 1}, retrying after delay")
-                        time.sleep(Config.RETRY_DELAY)
-                        continue
-                        
-                    response.raise_for_status()
-                    result = response.json()
-                    
-                    if not result.get('data') or not result['data']:
-                        logging.error("No image data in Venice.ai response")
-                        return None
-                    
-                    # Extract base64 image data
-                    image_data = result['data'][0].get('b64_json')
-                    if not image_data:
-                        logging.error("No base64 image data in Venice.ai response")
-                        return None
-                    
-                    # Decode base64 to bytes
-                    import base64
-                    image_bytes = base64.b64decode(image_data)
-                    logging.info("Successfully generated image using Venice.ai")
-                    return image_bytes
-                    
-                except requests.exceptions.RequestException as e:
-                    if attempt < Config.MAX_RETRIES - 1:
-                        logging.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                        time.sleep(Config.RETRY_DELAY)
-                    else:
-                        raise
-                        
         except Exception as e:
-            logging.error(f"Error generating image with Venice.ai: {str(e)}")
+            logging.error("Error generating image with Venice.ai: %s", e)
             
             # Check if the error might be related to prompt length
             error_str = str(e).lower()
@@ -1172,11 +1716,95 @@ class VeniceImageGenerator:
                 try:
                     # Fallback to Together AI
                     logging.info("Attempting fallback to Together AI for image generation")
-                    return ImageGenerator.generate_image(quote, art_style)
+                    if prompt is None:
+                        return await ImageGenerator.generate_image(quote, art_style, weather_data)
+                    # Reuse the prompt we already have instead of asking the LLM again;
+                    # Together AI has no 1500 character limit, so send it untruncated
+                    return await asyncio.to_thread(ImageGenerator._render_image, prompt)
                 except Exception as fallback_error:
-                    logging.error(f"Fallback to Together AI also failed: {str(fallback_error)}")
+                    logging.error("Fallback to Together AI also failed: %s", fallback_error)
+            
+            return None
+
+    @staticmethod
+    async def _request_image(optimized_prompt: str) -> Optional[io.BytesIO]:
+        """Request one image from Venice.ai; errors propagate to the caller."""
+        headers = {
+            'Authorization': f'Bearer {Config.VENICE_API_KEY}',
+            'Content-Type': 'application/json'
+        }
+        
+        # Venice.ai image generation parameters based on API docs
+        data = {
+            'model': 'hidream',
+            'prompt': optimized_prompt,
+            'size': '1024x1024',
+            'response_format': 'b64_json',
+            'output_format': 'png',
+            'quality': 'auto',
+            'style': 'natural',
+            'n': 1,
+            'background': 'auto',
+            'moderation': 'auto',
+            'output_compression': 100
+        }
+        
+        # Rate limits and transient failures are retried by the shared session's adapter;
+        # orjson encodes the body and parses the large base64 response in native code
+        response = await asyncio.to_thread(
+            get_http_session().post,
+            'https://api.venice.ai/api/v1/images/generations',
+            headers=headers,
+            data=orjson.dumps(data),
+            timeout=60  # Longer timeout for image generation
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        if not result.get('data') or not result['data']:
+            logging.error("No image data in Venice.ai response")
+            return None
+        
+        # Extract base64 image data
+        image_data = result['data'][0].get('b64_json')
+        if not image_data:
+            logging.error("No base64 image data in Venice.ai response")
+            return None
+        
+        # Decode base64 into an in-memory image buffer; a2b_base64 skips
+        # stray newlines in the payload on its own
+        image = io.BytesIO(a2b_base64(image_data))
+        logging.info("Successfully generated image using Venice.ai")
+        return image
+    
+    @staticmethod
+    async def _hedge_with_together(venice: asyncio.Task, prompt: str) -> Optional[io.BytesIO]:
+        """Race a slow Venice.ai request against Together AI and keep the first image.
+        
+        Args:
+            venice: The pending Venice.ai request
+            prompt: The untruncated prompt, sent to Together AI as is
             
+        Returns:
+            io.BytesIO: The first image produced, or None if both services fail
+        """
+        logging.warning("Venice.ai has not answered within %ss, also trying Together AI", Config.VENICE_HEDGE_DELAY)
+        together = asyncio.create_task(asyncio.to_thread(ImageGenerator._render_image, prompt))
+        pending = {venice, together}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        logging.error("Hedged image request failed: %s", task.exception())
+                    elif task.result() is not None:
+                        logging.info("Using image from %s", 'Venice.ai' if task is venice else 'Together AI')
+                        return task.result()
             return None
+        finally:
+            # Drop the slower request; a Together AI thread finishes on its own
+            for task in pending:
+                task.cancel()
 
 class ImageGeneratorFactory:
     """Factory class to create appropriate image generator based on configuration."""
@@ -1202,6 +1830,15 @@ class PromptLengthValidator:
     # Venice.ai has a strict 1500 character limit for image generation prompts
     VENICE_PROMPT_LIMIT = 1500
     
+    # Redundant phrases and filler words dropped from over-long prompts, in one pass
+    REDUNDANT_RE = re.compile(
+        r'the image (?:should|must|will|needs to|has to)|(?:make sure|ensure) the image'
+        r'|(?<= )(?:very|really|quite|extremely|absolutely) (?=\S)',
+        re.IGNORECASE
+    )
+    EXTRA_SPACES_RE = re.compile(r'[ \t]{2,}')
+    WORD_RE = re.compile(r'\S+')
+    
     @classmethod
     def validate_prompt_length(cls, prompt: str) -> tuple[bool, int]:
         """
@@ -1231,48 +1868,26 @@ class PromptLengthValidator:
         if len(prompt) <= cls.VENICE_PROMPT_LIMIT:
             return prompt
         
-        logging.info(f"Prompt length ({len(prompt)}) exceeds Venice.ai limit ({cls.VENICE_PROMPT_LIMIT}). Truncating...")
+        logging.info("Prompt length (%s) exceeds Venice.ai limit (%s). Truncating...", len(prompt), cls.VENICE_PROMPT_LIMIT)
         
-        # Start with the original prompt
-        truncated = prompt
+        # First, remove common redundant phrases and filler words
+        truncated = cls.EXTRA_SPACES_RE.sub(' ', cls.REDUNDANT_RE.sub('', prompt))
         
-        # First, try to remove common redundant phrases
-        redundant_phrases = [
-            "the image should",
-            "the image must",
-            "the image will",
-            "make sure the image",
-            "ensure the image",
-            "the image needs to",
-            "the image has to"
-        ]
+        # Usually that is enough and the text is still whole, so no cut is needed
+        if len(truncated) <= cls.VENICE_PROMPT_LIMIT:
+            logging.info("Prompt shortened from %s to %s characters", len(prompt), len(truncated))
+            return truncated
         
-        for phrase in redundant_phrases:
-            if len(truncated) <= cls.VENICE_PROMPT_LIMIT:
-                break
-            truncated = truncated.replace(phrase, "")
-        
-        # If still too long, try to remove repetitive words
-        if len(truncated) > cls.VENICE_PROMPT_LIMIT:
-            words_to_remove = ["very", "really", "quite", "extremely", "absolutely"]
-            for word in words_to_remove:
-                if len(truncated) <= cls.VENICE_PROMPT_LIMIT:
-                    break
-                truncated = truncated.replace(f" {word} ", " ")
-        
-        # If still too long, truncate at word boundary
-        if len(truncated) > cls.VENICE_PROMPT_LIMIT:
-            truncated = truncated[:cls.VENICE_PROMPT_LIMIT]
-            # Find the last space to avoid cutting words in half
-            last_space = truncated.rfind(' ')
-            if last_space > cls.VENICE_PROMPT_LIMIT * 0.8:  # Only if we're not losing too much
-                truncated = truncated[:last_space]
-        
-        # Add ellipsis if we truncated significantly
-        if len(truncated) < len(prompt) * 0.9:
-            truncated = truncated.rstrip() + "..."
-        
-        logging.info(f"Prompt truncated from {len(prompt)} to {len(truncated)} characters")
+        # Otherwise truncate at a word boundary, leaving room for the ellipsis
+        limit = cls.VENICE_PROMPT_LIMIT - 3
+        truncated = truncated[:limit]
+        # Find the last space to avoid cutting words in half
+        last_space = truncated.rfind(' ')
+        if last_space > limit * 0.8:  # Only if we're not losing too much
+            truncated = truncated[:last_space]
+        truncated = truncated.rstrip() + "..."
+        
+        logging.info("Prompt truncated from %s to %s characters", len(prompt), len(truncated))
         return truncated
     
     @classmethod
@@ -1289,10 +1904,10 @@ class PromptLengthValidator:
         is_valid, char_count = cls.validate_prompt_length(prompt)
         
         if is_valid:
-            logging.info(f"Prompt is within limit: {char_count}/{cls.VENICE_PROMPT_LIMIT} characters")
+            logging.info("Prompt is within limit: %s/%s characters", char_count, cls.VENICE_PROMPT_LIMIT)
             return prompt, False
         else:
-            logging.warning(f"Prompt exceeds limit: {char_count}/{cls.VENICE_PROMPT_LIMIT} characters")
+            logging.warning("Prompt exceeds limit: %s/%s characters", char_count, cls.VENICE_PROMPT_LIMIT)
             optimized_prompt = cls.truncate_prompt(prompt)
             return optimized_prompt, True
     
@@ -1308,7 +1923,8 @@ class PromptLengthValidator:
             dict: Statistics about the prompt
         """
         char_count = len(prompt)
-        word_count = len(prompt.split())
+        # Count the words lazily instead of materialising prompt.split()
+        word_count = sum(1 for _ in cls.WORD_RE.finditer(prompt))
         
         return {
             'character_count': char_count,
@@ -1318,6 +1934,153 @@ class PromptLengthValidator:
             'percentage_of_limit': (char_count / cls.VENICE_PROMPT_LIMIT) * 100
         }
 
+def _jpeg_dimensions(data: bytes) -> Optional[tuple]:
+    """Read (width, height) from a JPEG's SOF header without decoding pixels.
+    
+    Returns:
+        Optional[tuple]: Image dimensions, or None if data is not a parsable JPEG
+    """
+    if data[:2] != b'\xff\xd8':
+        return None
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if pos + 9 > len(data):
+                return None
+            height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
+
+class ImageCompressor:
+    """Class to re-encode generated images into compact JPEGs for upload."""
+    
+    # Twitter's limits; Telegram accepts anything within them as well
+    MAX_DIMENSION = 2048
+    MAX_BYTES = 4_500_000
+    
+    @staticmethod
+    def fits_limits(image_bytes: bytes) -> bool:
+        """Check whether data is already a JPEG within the upload limits."""
+        dimensions = _jpeg_dimensions(image_bytes)
+        return (dimensions is not None
+                and len(image_bytes) < ImageCompressor.MAX_BYTES
+                and max(dimensions) <= ImageCompressor.MAX_DIMENSION)
+    
+    @staticmethod
+    def encode(img: Image.Image) -> bytes:
+        """Encode an image as a progressive JPEG within the upload limits.
+        
+        Args:
+            img: Decoded image
+            
+        Returns:
+            bytes: JPEG data
+        """
+        max_size = (ImageCompressor.MAX_DIMENSION, ImageCompressor.MAX_DIMENSION)
+        if img.format == 'JPEG' and (img.size[0] > max_size[0] or img.size[1] > max_size[1]):
+            # Let libjpeg decode at 1/2, 1/4 or 1/8 scale instead of materialising full-res pixels
+            img.draft('RGB', max_size)
+        if img.mode == 'P' and 'transparency' in img.info:
+            img = img.convert('RGBA')
+        if img.mode in ('RGBA', 'LA'):
+            alpha = img.getchannel('A')
+            if alpha.getextrema()[0] < 255:
+                # Real transparency: composite onto white instead of exposing the hidden colour data
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img.convert('RGB'), mask=alpha)
+                img = background
+        if img.mode != 'RGB':
+            # Opaque images just drop the alpha band; no blending happens
+            img = img.convert('RGB')
+        if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        return ImageCompressor._save_jpeg(img)
+    
+    @staticmethod
+    def _save_jpeg(img: Image.Image) -> bytes:
+        """Save an RGB image with the upload encoder settings, shared by both decode paths."""
+        # Strip EXIF/XMP/ICC metadata: it only inflates the upload and can leak the prompt
+        img.info.pop('icc_profile', None)
+        output = io.BytesIO()
+        # No optimize=True Huffman pass and web-tuned quantization tables: the upload is
+        # transient and Twitter/Telegram re-encode it (4:2:0) server-side anyway
+        img.save(output, format='JPEG', quality=85, qtables='web_medium', progressive=True, subsampling=2,
+                 exif=b'', icc_profile=None)
+        if mozjpeg_lossless_optimization is None:
+            return output.getvalue()
+        return mozjpeg_lossless_optimization.optimize(output.getvalue())
+    
+    @staticmethod
+    def encode_bytes(image_bytes: bytes) -> bytes:
+        """Encode image data as a progressive JPEG within the upload limits.
+        
+        Uses libvips when pyvips is installed: its thumbnail shrinks JPEGs during
+        decoding and resizes with SIMD kernels. Otherwise falls back to Pillow.
+        Either way the JPEG itself is written by _save_jpeg, so the quantization
+        tables and the mozjpeg pass are the same on both paths.
+        
+        Args:
+            image_bytes: Encoded image data
+            
+        Returns:
+            bytes: JPEG data
+        """
+        if pyvips is None:
+            return ImageCompressor.encode(Image.open(io.BytesIO(image_bytes)))
+        
+        vimg = pyvips.Image.thumbnail_buffer(
+            image_bytes, ImageCompressor.MAX_DIMENSION,
+            height=ImageCompressor.MAX_DIMENSION, size='down'
+        )
+        if vimg.hasalpha():
+            # One background value per colour band: grey+alpha images have just one
+            vimg = vimg.flatten(background=[255] * (vimg.bands - 1))
+        if vimg.interpretation != 'srgb' or vimg.bands != 3:
+            vimg = vimg.colourspace('srgb')
+        if vimg.format != 'uchar':
+            vimg = vimg.cast('uchar')
+        img = Image.frombuffer('RGB', (vimg.width, vimg.height), vimg.write_to_memory(), 'raw', 'RGB', 0, 1)
+        return ImageCompressor._save_jpeg(img)
+    
+    @staticmethod
+    def compress(image: io.BytesIO) -> Optional[bytes]:
+        """Prepare the generated image for upload as a JPEG within Twitter's limits.
+        
+        A JPEG that already fits the limits is passed through unchanged. Anything
+        else is re-encoded as a progressive JPEG: Telegram and Twitter re-encode
+        uploads anyway, so sending a JPEG instead of the raw PNG cuts the upload
+        size several times over. Either way the result fits Twitter's limits,
+        so both sinks can share it without further work.
+        
+        Args:
+            image: Buffer holding the generated image
+            
+        Returns:
+            Optional[bytes]: JPEG data (the original bytes if they already fit),
+                or None if re-encoding fails
+        """
+        try:
+            # getvalue() shares the buffer's storage; getbuffer() would unshare and copy it
+            original = image.getvalue()
+            if ImageCompressor.fits_limits(original):
+                logging.info("Image is already a JPEG within limits, sending it unchanged")
+                return original
+            compressed = ImageCompressor.encode_bytes(original)
+            logging.info("Compressed image from %s to %s bytes", len(original), len(compressed))
+            return compressed
+        except Exception as e:
+            logging.error("Error compressing image: %s", e)
+            return None
+
 class TelegramBot:
     """Class to handle Telegram bot operations."""
     
@@ -1328,11 +2091,13 @@ class TelegramBot:
             token = Config.get_telegram_token()
             chat_id = Config.get_telegram_chat_id()
             
-            logging.info(f"Using {'production' if Config.is_production() else 'test'} environment")
-            logging.info(f"Token: {token[:10]}...")  # Only log first 10 chars for security
-            logging.info(f"Chat ID: {chat_id}")
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("Using %s environment", 'production' if Config.is_production() else 'test')
+                logging.info("Token: %s...", token[:10])  # Only log first 10 chars for security
+                logging.info("Chat ID: %s", chat_id)
             
-            bot = Bot(token=token)
+            bot = _get_telegram_bot()
+            await TELEGRAM_LIMITER.acquire()
             await bot.send_photo(
                 chat_id=chat_id,
                 photo=image_bytes,
@@ -1342,170 +2107,224 @@ class TelegramBot:
             return True
             
         except Exception as e:
-            logging.error(f"Error sending image to Telegram: {str(e)}")
+            logging.error("Error sending image to Telegram: %s", e)
             return False
 
-    @staticmethod
-    def send_image(image_bytes: bytes, caption: str) -> bool:
-        """Send image to Telegram channel."""
-        return asyncio.run(TelegramBot.send_image_async(image_bytes, caption))
+_BASE_TAGS = "#Bible21 #VerseOfTheDay"
+
+@lru_cache(maxsize=64)
+def _caption_tags(style_name: str) -> str:
+    """Build the tweet's hashtag line for an art style, e.g. 'art_deco' -> '... #ArtDeco'."""
+    return f"{_BASE_TAGS} #" + style_name.replace('_', ' ').title().replace(' ', '')
 
 class TwitterBot:
     """Class to handle Twitter bot operations."""
     
     def __init__(self):
         """Initialize Twitter client with authentication."""
-        self.client = tweepy.Client(
-            consumer_key=Config.TWITTER_API_KEY,
-            consumer_secret=Config.TWITTER_API_SECRET,
-            access_token=Config.TWITTER_ACCESS_TOKEN,
-            access_token_secret=Config.TWITTER_ACCESS_TOKEN_SECRET
-        )
-        self.media_client = tweepy.API(tweepy.OAuth1UserHandler(
-            Config.TWITTER_API_KEY,
-            Config.TWITTER_API_SECRET,
-            Config.TWITTER_ACCESS_TOKEN,
-            Config.TWITTER_ACCESS_TOKEN_SECRET
-        ))
+        self.client, self.media_client = _get_twitter_clients()
             
     def optimize_image(self, image_bytes: bytes) -> bytes:
-        """Optimize image for Twitter upload."""
+        """Optimize image for Twitter upload; images that already fit are returned as is."""
+        # Already a JPEG within Twitter's limits: skip the decode/re-encode round-trip
+        if ImageCompressor.fits_limits(image_bytes):
+            return image_bytes
+        
         try:
+            # Image.open only parses the header; pixels are not decoded until needed
             img = Image.open(io.BytesIO(image_bytes))
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            max_size = (2048, 2048)
-            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                img.thumbnail(max_size, Image.Resampling.LANCZOS)
-            output = io.BytesIO()
-            img.save(output, format='JPEG', quality=85, optimize=True)
-            return output.getvalue()
+            if (img.mode == 'RGB' and len(image_bytes) < ImageCompressor.MAX_BYTES
+                    and max(img.size) <= ImageCompressor.MAX_DIMENSION):
+                return image_bytes
+            return ImageCompressor.encode_bytes(image_bytes)
         except Exception as e:
-            logging.error(f"Error optimizing image for Twitter: {str(e)}")
+            logging.error("Error optimizing image for Twitter: %s", e)
             return image_bytes
             
     def format_caption(self, quote: str, art_style: dict, weather_info: str) -> str:
         """Format caption for Twitter post."""
-        caption = f"{quote}\n\n"
-        hashtags = ["#Bible21", "#VerseOfTheDay"]
-        style_name = art_style['name'].replace('_', ' ').title()
-        style_hashtag = f"#{style_name.replace(' ', '')}"
-        hashtags.append(style_hashtag)
-        caption += " ".join(hashtags)
-        return caption
-        
-    async def post_image(self, image_bytes: bytes, quote: str, art_style: dict, weather_info: str) -> bool:
-        """Post image to Twitter with caption."""
+        return f"{quote}\n\n{_caption_tags(art_style['name'])}"
+        
+    async def post_image(self, image_bytes: bytes, quote: str, art_style: dict, weather_info: str,
+                         optimized: bool = False) -> bool:
+        """Post image to Twitter with caption.
+        
+        Args:
+            image_bytes: Image data to upload
+            quote: Quote used as the tweet text
+            art_style: Art style used for the hashtag
+            weather_info: Weather summary line
+            optimized: Whether image_bytes already came from ImageCompressor
+            
+        Returns:
+            bool: True if the tweet was posted or Twitter posting is disabled
+        """
         if not Config.is_twitter_enabled():
             logging.info("Twitter posting is disabled")
             return True
             
         try:
-            optimized_image = self.optimize_image(image_bytes)
+            optimized_image = image_bytes if optimized else await asyncio.to_thread(self.optimize_image, image_bytes)
             caption = self.format_caption(quote, art_style, weather_info)
             
+            # tweepy sniffs the type with tell()/read(32)/seek() and requests then read()s the
+            # whole buffer; a BytesIO over immutable bytes shares their storage, so neither copies
+            media_file = io.BytesIO(optimized_image)
+            
             try:
-                media = self.media_client.media_upload(filename="image.jpg", file=io.BytesIO(optimized_image))
-                response = self.client.create_tweet(
+                # tweepy is synchronous; run it in a worker thread so the Telegram upload proceeds meanwhile
+                media = await asyncio.to_thread(
+                    self.media_client.media_upload,
+                    filename="image.jpg",
+                    file=media_file
+                )
+                response = await asyncio.to_thread(
+                    self.client.create_tweet,
                     text=caption,
                     media_ids=[media.media_id]
                 )
-                logging.info(f"Successfully posted to Twitter: {response.data['id']}")
-                return True
-            except Exception as e:
-                logging.error(f"Twitter posting failed: {str(e)}")
+                logging.info("Successfully posted to Twitter: %s", response.data['id'])
                 return True
+            except tweepy.TweepyException as e:
+                # Already retried by the sessions' adapters; report it rather than masking it
+                logging.error("Twitter posting failed: %s", e)
+                return False
                 
         except Exception as e:
-            logging.error(f"Error in Twitter posting process: {str(e)}")
-            return True
+            logging.error("Error in Twitter posting process: %s", e)
+            return False
+
+async def fetch_quote_and_weather(quote_fetcher: QuoteFetcher) -> tuple[Optional[str], Optional[dict]]:
+    """Fetch the Bible quote and the weather data concurrently.
+    
+    Both are independent network calls, so the fetch phase takes as long as
+    the slower of the two instead of their sum.
+    
+    Args:
+        quote_fetcher: The quote fetcher to use
+        
+    Returns:
+        tuple: (quote, weather_data)
+    """
+    quote, weather_data = await asyncio.gather(
+        quote_fetcher.fetch_quote(),
+        asyncio.to_thread(WeatherAPI.fetch_weather)
+    )
+    return quote, weather_data
 
-def process_quote_and_image(quote: str) -> bool:
+async def process_quote_and_image(quote: str, weather_data: Optional[dict]) -> bool:
     """Process the quote and generate/send image."""
     try:
         # Get weather info
-        weather_info = WeatherAPI.format_weather_for_caption(WeatherAPI.fetch_weather())
+        weather_info = WeatherAPI.format_weather_for_caption(weather_data)
         
         # Get current date
         current_date = datetime.now().strftime('%d/%m/%y')
         
         # Get art style once and reuse it
-        art_style = GroqPromptGenerator.get_random_art_style()
+        art_style = PromptGenerator.get_random_art_style()
         
-        # Generate image using the selected art style and service
+        # Generate image using the selected art style and service, reusing the
+        # weather data fetched alongside the quote for the prompt
         image_generator = ImageGeneratorFactory.get_image_generator()
-        image_bytes = image_generator.generate_image(quote, art_style)
-        if not image_bytes:
+        image = await image_generator.generate_image(quote, art_style, weather_data)
+        if image is None:
             return False
+        
+        # Compress once; both uploads share the same immutable JPEG payload. The decode,
+        # resize and encode are CPU-bound, so keep them off the event loop
+        image_bytes = await asyncio.to_thread(ImageCompressor.compress, image)
+        compressed = image_bytes is not None
+        if not compressed:
+            # Send the original instead; Twitter's optimize_image then checks its limits
+            image_bytes = image.getvalue()
             
         # Format Telegram caption (with weather, date, and shortcut at the end)
         telegram_caption = f"{weather_info}{current_date}\n\n{quote}({art_style['shortcut']})"
         
-        # Send to Telegram
-        telegram_success = TelegramBot.send_image(image_bytes, telegram_caption)
-        if not telegram_success:
-            return False
+        telegram_post = TelegramBot.send_image_async(image_bytes, telegram_caption)
         
-        # Only proceed with Twitter if enabled
+        # Send to Telegram and, if enabled, to Twitter concurrently
         if Config.is_twitter_enabled():
             # Format Twitter caption (quote with verse reference)
             twitter_caption = quote  # The quote already includes the verse reference
             
-            # Send to Twitter
             twitter_bot = TwitterBot()
-            twitter_success = asyncio.run(twitter_bot.post_image(image_bytes, twitter_caption, art_style, weather_info))
+            # return_exceptions keeps an unexpected Twitter error from discarding the Telegram result
+            telegram_success, twitter_success = await asyncio.gather(
+                telegram_post,
+                twitter_bot.post_image(image_bytes, twitter_caption, art_style, weather_info, optimized=compressed),
+                return_exceptions=True
+            )
+            if isinstance(telegram_success, BaseException):
+                raise telegram_success
             # Twitter success is optional, we don't fail the whole process if Twitter fails
-            if not twitter_success:
+            if twitter_success is not True:
                 logging.warning("Twitter posting failed, but continuing with process")
         else:
             logging.info("Twitter posting is disabled")
+            telegram_success = await telegram_post
         
-        return True  # Return True if at least Telegram was successful
+        return telegram_success  # Return True if at least Telegram was successful
         
     except Exception as e:
-        logging.error(f"Error processing quote and image: {str(e)}")
+        logging.error("Error processing quote and image: %s", e)
         return False
 
-def main():
-    """Main function to run the script."""
+async def run_once():
+    """Fetch the quote of the day, generate its image and post it."""
     try:
         logging.info("Starting Bible quote image generator")
-        logging.info(f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Reload environment variables at start
-        Config.reload_env()
+        logging.info("Current time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         
         # Validate configuration
-        if not Config.validate_telegram_config():
-            logging.error("Invalid Telegram configuration. Exiting.")
-            return
-            
-        if not Config.validate_twitter_config():
-            logging.error("Invalid Twitter configuration. Exiting.")
+        if not Config.validate_all():
             return
             
-        if not Config.validate_ai_config():
-            logging.error("Invalid AI configuration. Exiting.")
-            return
-            
-        # Use new QuoteFetcher
+        # Use new QuoteFetcher, fetching weather alongside the quote
         quote_fetcher = QuoteFetcher()
-        quote = quote_fetcher.fetch_quote()
+        quote, weather_data = await fetch_quote_and_weather(quote_fetcher)
         #quote = Config.TEST_QUOTE
         
         if not quote:
             logging.error("Failed to fetch Bible quote")
             return
             
-        logging.info(f"Successfully fetched quote: {quote}")
+        logging.info("Successfully fetched quote: %s", quote)
         
-        if process_quote_and_image(quote):
+        if await process_quote_and_image(quote, weather_data):
             logging.info("Quote and image process completed successfully")
         else:
             logging.error("Failed to complete quote and image process")
             
     except Exception as e:
-        logging.error(f"Unexpected error occurred: {str(e)}")
+        logging.error("Unexpected error occurred: %s", e)
+
+async def main():
+    """Main function to run the script.
+    
+    With RUN_INTERVAL set, the process stays up and runs every RUN_INTERVAL
+    seconds, so the API clients, HTTP connections and in-process caches are
+    reused instead of being rebuilt by every scheduled invocation.
+    """
+    try:
+        # Reload environment variables at start
+        Config.reload_env()
+        if Config.RUN_INTERVAL <= 0:
+            await run_once()
+            return
+        
+        logging.info("Running every %s seconds", Config.RUN_INTERVAL)
+        while True:
+            await run_once()
+            await asyncio.sleep(Config.RUN_INTERVAL)
+            # Pick up .env edits between runs without re-reading an unchanged file
+            if Config.reload_env_if_changed():
+                # The shared clients hold the old tokens and keys; rebuild them on next use
+                await reset_api_clients()
+    finally:
+        await reset_api_clients()
+        close_http_session()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def big(tmp_path_factory):
+    """The bible_image_generator module, imported from a scratch directory.
+    
+    Importing it opens bible_image_generator.log in the working directory,
+    so the import runs elsewhere to keep the checkout clean.
+    """
+    run_dir = tmp_path_factory.mktemp('run')
+    cwd = os.getcwd()
+    os.chdir(run_dir)
+    try:
+        import bible_image_generator
+    finally:
+        os.chdir(cwd)
+    return bible_image_generator
+
+
+
+@pytest.fixture
+def cache_dir(big, tmp_path, monkeypatch):
+    """Point the response and prompt caches at an empty directory."""
+    monkeypatch.setattr(big, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(big, 'PROMPT_CACHE_DIR', str(tmp_path / 'prompts'))
+    monkeypatch.setattr(big, '_MEMORY_CACHE', {})
+    return tmp_path
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+
+def test_ttl_cache_returns_fresh_entry_without_calling(big, cache_dir):
+    calls = []
+    
+    @big.ttl_cache(seconds=3600, key=lambda: 'https://example.test/quote')
+    def fetch():
+        calls.append(1)
+        return 'quote'
+    
+    assert fetch() == 'quote'
+    assert fetch() == 'quote'
+    assert len(calls) == 1
+
+
+def test_ttl_cache_reads_entries_from_disk(big, cache_dir, monkeypatch):
+    @big.ttl_cache(seconds=3600, key=lambda: 'https://example.test/disk')
+    def fetch():
+        return 'from network'
+    
+    fetch()
+    monkeypatch.setattr(big, '_MEMORY_CACHE', {})
+    
+    @big.ttl_cache(seconds=3600, key=lambda: 'https://example.test/disk')
+    def offline():
+        raise AssertionError('fresh disk entry should have been used')
+    
+    assert offline() == 'from network'
+
+
+def test_ttl_cache_refetches_expired_entry(big, cache_dir):
+    key = 'https://example.test/expired'
+    big._MEMORY_CACHE[key] = big.CacheEntry(datetime.now() - timedelta(seconds=120), 'old')
+    
+    @big.ttl_cache(seconds=60, key=lambda: key)
+    def fetch():
+        return 'new'
+    
+    assert fetch() == 'new'
+
+
+def test_ttl_cache_refetches_entry_from_previous_day(big, cache_dir):
+    key = 'https://example.test/yesterday'
+    big._MEMORY_CACHE[key] = big.CacheEntry(datetime.now() - timedelta(days=1), 'yesterday')
+    
+    @big.ttl_cache(seconds=10 ** 6, key=lambda: key)
+    def fetch():
+        return 'today'
+    
+    assert fetch() == 'today'
+
+
+def test_ttl_cache_falls_back_to_same_day_entry(big, cache_dir):
+    key = 'https://example.test/outage'
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    big._MEMORY_CACHE[key] = big.CacheEntry(midnight, 'earlier today')
+    
+    @big.ttl_cache(seconds=0, key=lambda: key)
+    def fetch():
+        return None
+    
+    assert fetch() == 'earlier today'
+
+
+def test_ttl_cache_ignores_entry_from_previous_day_on_failure(big, cache_dir):
+    key = 'https://example.test/outage-yesterday'
+    big._MEMORY_CACHE[key] = big.CacheEntry(datetime.now() - timedelta(days=1), 'yesterday')
+    
+    @big.ttl_cache(seconds=10 ** 6, key=lambda: key)
+    def fetch():
+        return None
+    
+    assert fetch() is None
+
+
+def test_quote_source_does_not_serve_yesterdays_quote(big, cache_dir, monkeypatch):
+    source = big.Bible21QuoteSource()
+    big._MEMORY_CACHE[source.url] = big.CacheEntry(datetime.now() - timedelta(days=1), 'yesterday')
+    
+    def unreachable(url, limit=None):
+        raise big.requests.ConnectionError('offline')
+    
+    monkeypatch.setattr(big, '_get_page', unreachable)
+    assert source.fetch_quote() is None
+
+
+def test_disk_cache_hit_skips_call(big, cache_dir):
+    calls = []
+    
+    @big.disk_cache(ttl=3600, key=lambda text: text)
+    async def generate(text):
+        calls.append(text)
+        return text.upper()
+    
+    assert asyncio.run(generate('a')) == 'A'
+    assert asyncio.run(generate('a')) == 'A'
+    assert calls == ['a']
+
+
+def test_disk_cache_ignores_expired_entry(big, cache_dir):
+    calls = []
+    
+    @big.disk_cache(ttl=60, key=lambda text: text)
+    async def generate(text):
+        calls.append(text)
+        return f'{text}-{len(calls)}'
+    
+    assert asyncio.run(generate('a')) == 'a-1'
+    path = os.path.join(big.PROMPT_CACHE_DIR, 'a.txt')
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert asyncio.run(generate('a')) == 'a-2'
+
+
+def test_disk_cache_does_not_store_empty_results(big, cache_dir):
+    calls = []
+    
+    @big.disk_cache(ttl=3600, key=lambda text: text)
+    async def generate(text):
+        calls.append(text)
+        return None
+    
+    asyncio.run(generate('a'))
+    asyncio.run(generate('a'))
+    assert len(calls) == 2
+
+
+def test_disk_cache_single_flights_concurrent_calls(big, cache_dir):
+    calls = []
+    
+    @big.disk_cache(ttl=3600, key=lambda text: text)
+    async def generate(text):
+        calls.append(text)
+        await asyncio.sleep(0.05)
+        return text.upper()
+    
+    async def run():
+        return await asyncio.gather(*(generate('a') for _ in range(5)))
+    
+    assert asyncio.run(run()) == ['A'] * 5
+    assert calls == ['a']
+
+
+def test_prompt_cache_key_covers_weather(big):
+    key = big.prompt_cache_key('groq')
+    style = {'name': 'cubism'}
+    sunny = big.WeatherAPI.extract_all({'daily': {'data': [{'weather': 'sunny', 'all_day': {}}]}})[0]
+    rainy = big.WeatherAPI.extract_all({'daily': {'data': [{'weather': 'rain', 'all_day': {}}]}})[0]
+    assert key('quote', style, sunny) == key('quote', style, weather_context=sunny)
+    assert key('quote', style, sunny) != key('quote', style, rainy)
+    assert key('quote', style, sunny) != key('quote', style)
+    assert key('quote', style) != big.prompt_cache_key('venice')('quote', style)
+
+
+def test_create_prompt_formats_weather_once(big, cache_dir, monkeypatch, caplog):
+    class Generator:
+        @staticmethod
+        @big.disk_cache(ttl=3600, key=big.prompt_cache_key('test'))
+        async def generate_enhanced_prompt(quote, art_style, weather_context=''):
+            return f'{quote} in {weather_context}'
+    
+    monkeypatch.setattr(big.Config, 'is_prompt_enhancement_enabled', classmethod(lambda cls: True))
+    monkeypatch.setattr(big.PromptGeneratorFactory, 'get_prompt_generator', staticmethod(Generator))
+    weather = {'daily': {'data': [{'weather': 'volcano', 'all_day': {}}]}}
+    with caplog.at_level(logging.WARNING):
+        prompt = asyncio.run(big.ImageGenerator.create_prompt('quote', {'name': 'cubism'}, weather))
+    assert prompt.startswith('quote in Daily weather forecast: volcano')
+    assert sum('No weather icon found' in r.getMessage() for r in caplog.records) == 1
@@ -0,0 +1,61 @@
+import http.server
+import threading
+import time
+
+import pytest
+import requests
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    hits = {}
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        if self.path == '/slow':
+            time.sleep(1)
+        status = 503 if self.path == '/busy' else 200
+        self.send_response(status)
+        self.send_header('Retry-After', '600')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+@pytest.fixture
+def server():
+    srv = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    _Handler.hits = {}
+    yield f'http://127.0.0.1:{srv.server_port}'
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def session(big, monkeypatch):
+    monkeypatch.setattr(big.Config, 'RETRY_DELAY', 0)
+    monkeypatch.setattr(big.JitteredRetry, 'RETRY_AFTER_CAP', 0)
+    big.close_http_session()
+    yield big.get_http_session()
+    big.close_http_session()
+
+
+def test_post_is_not_retried_after_read_timeout(big, server, session):
+    with pytest.raises(requests.ReadTimeout):
+        session.post(server + '/slow', data=b'x', timeout=0.2)
+    assert _Handler.hits['/slow'] == 1
+
+
+def test_post_is_retried_on_retryable_status(big, server, session):
+    response = session.post(server + '/busy', data=b'x', timeout=2)
+    assert response.status_code == 503
+    assert _Handler.hits['/busy'] == big.Config.MAX_RETRIES
+
+
+def test_retry_after_is_capped(big, server, session):
+    start = time.monotonic()
+    session.post(server + '/busy', data=b'x', timeout=2)
+    assert time.monotonic() - start < 5
@@ -0,0 +1,77 @@
+import asyncio
+import io
+import time
+
+import pytest
+
+
+@pytest.fixture
+def venice(big, monkeypatch):
+    """VeniceImageGenerator with the basic prompt and a 50 ms hedge delay."""
+    monkeypatch.setattr(big.Config, 'is_prompt_enhancement_enabled', classmethod(lambda cls: False))
+    monkeypatch.setattr(big.Config, 'VENICE_HEDGE_DELAY', 0.05)
+    return big.VeniceImageGenerator
+
+
+def _generate(big, generator):
+    style = {'name': next(iter(big.IMAGE_ART))}
+    return asyncio.run(generator.generate_image('quote', style))
+
+
+def _venice_after(delay, result=b'venice', error=None):
+    async def request(prompt):
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return io.BytesIO(result)
+    return request
+
+
+def _together_after(delay, calls, result=b'together'):
+    def render(prompt):
+        calls.append(prompt)
+        time.sleep(delay)
+        return io.BytesIO(result) if result is not None else None
+    return render
+
+
+def test_fast_venice_is_not_hedged(big, venice, monkeypatch):
+    calls = []
+    monkeypatch.setattr(venice, '_request_image', staticmethod(_venice_after(0)))
+    monkeypatch.setattr(big.ImageGenerator, '_render_image', staticmethod(_together_after(0, calls)))
+    assert _generate(big, venice).getvalue() == b'venice'
+    assert calls == []
+
+
+def test_slow_venice_is_hedged_with_together(big, venice, monkeypatch):
+    calls = []
+    monkeypatch.setattr(venice, '_request_image', staticmethod(_venice_after(5)))
+    monkeypatch.setattr(big.ImageGenerator, '_render_image', staticmethod(_together_after(0, calls)))
+    start = time.monotonic()
+    assert _generate(big, venice).getvalue() == b'together'
+    # The slow Venice request is cancelled instead of awaited
+    assert time.monotonic() - start < 2
+    assert len(calls) == 1
+
+
+def test_hedge_waits_for_together_when_venice_fails(big, venice, monkeypatch):
+    calls = []
+    monkeypatch.setattr(venice, '_request_image', staticmethod(_venice_after(0.1, error=RuntimeError('boom'))))
+    monkeypatch.setattr(big.ImageGenerator, '_render_image', staticmethod(_together_after(0.3, calls)))
+    assert _generate(big, venice).getvalue() == b'together'
+
+
+def test_hedge_keeps_venice_when_together_fails(big, venice, monkeypatch):
+    calls = []
+    monkeypatch.setattr(venice, '_request_image', staticmethod(_venice_after(0.3)))
+    monkeypatch.setattr(big.ImageGenerator, '_render_image', staticmethod(_together_after(0, calls, result=None)))
+    assert _generate(big, venice).getvalue() == b'venice'
+
+
+def test_disabled_hedge_waits_for_venice(big, venice, monkeypatch):
+    calls = []
+    monkeypatch.setattr(big.Config, 'VENICE_HEDGE_DELAY', 0)
+    monkeypatch.setattr(venice, '_request_image', staticmethod(_venice_after(0.2)))
+    monkeypatch.setattr(big.ImageGenerator, '_render_image', staticmethod(_together_after(0, calls)))
+    assert _generate(big, venice).getvalue() == b'venice'
+    assert calls == []
@@ -0,0 +1,71 @@
+import io
+
+from PIL import Image
+
+
+def _encode(size, fmt='JPEG', **kwargs):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, 'red').save(buffer, format=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+def test_jpeg_dimensions_baseline(big):
+    assert big._jpeg_dimensions(_encode((320, 200))) == (320, 200)
+
+
+def test_jpeg_dimensions_progressive_with_exif_and_icc(big):
+    data = _encode((64, 48), progressive=True, exif=b'Exif\x00\x00' + b'\x00' * 64, icc_profile=b'\x00' * 256)
+    assert big._jpeg_dimensions(data) == (64, 48)
+
+
+def test_jpeg_dimensions_rejects_non_jpeg(big):
+    assert big._jpeg_dimensions(_encode((10, 10), fmt='PNG')) is None
+    assert big._jpeg_dimensions(b'') is None
+
+
+def test_jpeg_dimensions_rejects_truncated_header(big):
+    data = _encode((10, 10))
+    sof = data.index(b'\xff\xc0')
+    assert big._jpeg_dimensions(data[:sof + 6]) is None
+    assert big._jpeg_dimensions(data[:4]) is None
+
+
+def test_fits_limits(big):
+    compressor = big.ImageCompressor
+    assert compressor.fits_limits(_encode((1024, 768)))
+    assert not compressor.fits_limits(_encode((compressor.MAX_DIMENSION + 1, 10)))
+    assert not compressor.fits_limits(_encode((10, 10), fmt='PNG'))
+
+
+def test_compress_returns_none_on_undecodable_input(big):
+    assert big.ImageCompressor.compress(io.BytesIO(b'not an image')) is None
+
+
+def test_compress_flattens_and_clamps(big):
+    buffer = io.BytesIO()
+    Image.new('RGBA', (3000, 100), (0, 0, 255, 0)).save(buffer, format='PNG')
+    data = big.ImageCompressor.compress(buffer)
+    assert Image.open(io.BytesIO(data)).size == (2048, 68)
+    # Fully transparent pixels are composited onto white
+    assert Image.open(io.BytesIO(data)).getpixel((10, 10)) > (240, 240, 240)
+
+
+def test_compress_passes_fitting_jpeg_through(big):
+    data = _encode((1024, 768))
+    assert big.ImageCompressor.compress(io.BytesIO(data)) == data
+
+
+def test_encode_bytes_flattens_grey_with_alpha(big):
+    # Runs through libvips when pyvips is installed, Pillow otherwise
+    buffer = io.BytesIO()
+    Image.new('LA', (64, 64), (0, 0)).save(buffer, format='PNG')
+    img = Image.open(io.BytesIO(big.ImageCompressor.encode_bytes(buffer.getvalue())))
+    assert img.mode == 'RGB'
+    assert img.getpixel((10, 10)) > (240, 240, 240)
+
+
+def test_twitter_optimize_image_keeps_compressed_output(big):
+    # TwitterBot.__init__ builds API clients; optimize_image does not use them
+    bot = big.TwitterBot.__new__(big.TwitterBot)
+    for data in (_encode((1024, 768)), big.ImageCompressor.compress(io.BytesIO(_encode((3000, 10), fmt='PNG')))):
+        assert bot.optimize_image(data) is data
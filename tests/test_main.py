@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+
+class StopLoop(Exception):
+    pass
+
+
+@pytest.fixture
+def loop_env(big, monkeypatch):
+    """Stub out the run, the .env file and the client teardown around main()."""
+    events = []
+    # Read by the initial load, after the first run, after the second run and by its reload
+    mtimes = iter([1.0, 1.0, 2.0, 2.0])
+    runs = []
+    
+    async def run_once():
+        runs.append(1)
+        events.append('run')
+        if len(runs) == 3:
+            raise StopLoop
+    
+    async def reset_api_clients():
+        events.append('reset')
+    
+    def load_dotenv(override=False):
+        events.append('load')
+        if len(runs) == 2:
+            monkeypatch.setenv('GROQ_API_KEY', 'rotated')
+    
+    # Restore whatever reload_env overwrites
+    for key in big.Config._CREDENTIAL_KEYS:
+        monkeypatch.setattr(big.Config, key, getattr(big.Config, key))
+    monkeypatch.setattr(big.Config, 'runtime', big.Config.runtime)
+    monkeypatch.setattr(big.Config, '_env_mtime', big.Config._env_mtime)
+    monkeypatch.setattr(big.Config, 'RUN_INTERVAL', 0.01)
+    monkeypatch.setenv('GROQ_API_KEY', 'original')
+    monkeypatch.setattr(big, '_dotenv_mtime', lambda: next(mtimes))
+    monkeypatch.setattr(big, 'load_dotenv', load_dotenv)
+    monkeypatch.setattr(big, 'run_once', run_once)
+    monkeypatch.setattr(big, 'reset_api_clients', reset_api_clients)
+    monkeypatch.setattr(big, 'close_http_session', lambda: events.append('close'))
+    return events
+
+
+def test_run_interval_reloads_changed_env_and_resets_clients(big, loop_env):
+    with pytest.raises(StopLoop):
+        asyncio.run(big.main())
+    # Unchanged .env after the first run, a rotated key after the second
+    assert loop_env == ['load', 'run', 'run', 'load', 'reset', 'run', 'reset', 'close']
+    assert big.Config.GROQ_API_KEY == 'rotated'
+
+
+def test_without_run_interval_runs_once(big, loop_env, monkeypatch):
+    monkeypatch.setattr(big.Config, 'RUN_INTERVAL', 0)
+    asyncio.run(big.main())
+    assert loop_env == ['load', 'run', 'reset', 'close']
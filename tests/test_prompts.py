@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+
+def test_truncate_prompt_keeps_short_prompt(big):
+    assert big.PromptLengthValidator.truncate_prompt('short prompt') == 'short prompt'
+
+
+def test_truncate_prompt_strips_redundant_phrases(big):
+    validator = big.PromptLengthValidator
+    prompt = 'Ensure the image is abstract, the image should be very calm  and really warm. ' * 30
+    truncated = validator.truncate_prompt(prompt)
+    assert len(prompt) > validator.VENICE_PROMPT_LIMIT
+    for phrase in ('the image should', 'Ensure the image', 'very', 'really', '  '):
+        assert phrase not in truncated
+
+
+def test_truncate_prompt_cleanup_pass_without_ellipsis(big):
+    validator = big.PromptLengthValidator
+    prompt = 'The image should be very calm. ' * 60
+    truncated = validator.truncate_prompt(prompt)
+    assert len(truncated) <= validator.VENICE_PROMPT_LIMIT
+    assert 'very' not in truncated and not truncated.endswith('...')
+
+
+def test_truncate_prompt_cuts_at_word_boundary(big):
+    validator = big.PromptLengthValidator
+    truncated = validator.truncate_prompt('word ' * 400)
+    assert len(truncated) <= validator.VENICE_PROMPT_LIMIT
+    assert truncated.endswith('word...')
+
+
+def test_truncate_prompt_never_exceeds_limit(big):
+    validator = big.PromptLengthValidator
+    assert len(validator.truncate_prompt('x' * 5000)) == validator.VENICE_PROMPT_LIMIT
+
+
+@pytest.mark.parametrize('generator', ['ImageGenerator', 'VeniceImageGenerator'])
+def test_create_prompt_falls_back_to_basic_prompt(big, monkeypatch, generator):
+    class Failing:
+        @staticmethod
+        async def generate_enhanced_prompt(quote, art_style, weather_context=''):
+            return None
+    
+    style = {'name': next(iter(big.IMAGE_ART))}
+    monkeypatch.setattr(big.Config, 'is_prompt_enhancement_enabled', classmethod(lambda cls: True))
+    monkeypatch.setattr(big.PromptGeneratorFactory, 'get_prompt_generator', staticmethod(Failing))
+    prompt = asyncio.run(getattr(big, generator).create_prompt('quote', style))
+    assert prompt == big._basic_prompt('quote', style['name'])
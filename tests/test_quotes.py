@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def bible21(big):
+    return big.Bible21QuoteSource()
+
+
+def test_match_quote_strips_tags_and_entities(bible21):
+    page = '<div><span class="daily-word__quote">Pán &amp; <b>Bůh</b> </span></div>'.encode('utf-8')
+    assert bible21._match_quote(page) == 'Pán & Bůh'
+
+
+def test_match_quote_accepts_extra_classes(bible21):
+    page = b'<span id="q" class="lead daily-word__quote big">Text</span>'
+    assert bible21._match_quote(page) == 'Text'
+
+
+def test_match_quote_requires_whole_class_token(bible21):
+    assert bible21._match_quote(b'<span class="daily-word__quote-ref">Ref</span>') is None
+    assert bible21._match_quote(b'<span class="xdaily-word__quote">Ref</span>') is None
+
+
+def test_match_quote_leaves_nested_spans_to_parser(bible21):
+    page = b'<span class="daily-word__quote">A <span class="ref">B</span> C</span>'
+    assert bible21._match_quote(page) is None
+
+
+def test_match_quote_leaves_non_utf8_to_parser(bible21):
+    assert bible21._match_quote(b'<span class="daily-word__quote">\xe8\xff</span>') is None
+
+
+def test_match_quote_without_match(bible21):
+    assert bible21._match_quote(b'<html><body>No quote today</body></html>') is None
+
+
+def test_fetcher_uses_fallback_when_primary_raises(big):
+    fetcher = big.QuoteFetcher()
+    
+    def broken():
+        raise RuntimeError('boom')
+    
+    fetcher.sources[fetcher.current_source].fetch_quote = broken
+    fetcher.sources[fetcher.fallback_source].fetch_quote = lambda: 'fallback quote'
+    assert asyncio.run(fetcher.fetch_quote()) == 'fallback quote'
+
+
+def test_fetcher_prefers_primary(big):
+    fetcher = big.QuoteFetcher()
+    fetcher.sources[fetcher.current_source].fetch_quote = lambda: 'primary quote'
+    fetcher.sources[fetcher.fallback_source].fetch_quote = lambda: 'fallback quote'
+    assert asyncio.run(fetcher.fetch_quote()) == 'primary quote'
+
+
+def test_fetcher_uses_fallback_when_primary_finds_nothing(big):
+    fetcher = big.QuoteFetcher()
+    fetcher.sources[fetcher.current_source].fetch_quote = lambda: None
+    fetcher.sources[fetcher.fallback_source].fetch_quote = lambda: 'fallback quote'
+    assert asyncio.run(fetcher.fetch_quote()) == 'fallback quote'
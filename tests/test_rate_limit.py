@@ -0,0 +1,26 @@
+import asyncio
+import time
+
+
+def test_token_bucket_allows_burst_then_waits(big):
+    bucket = big.AsyncTokenBucket(rpm=60)
+    assert bucket._reserve(0) == 0
+    for _ in range(59):
+        bucket._reserve(0)
+    # The 61st request in the same minute waits about a second for a refill
+    assert 0.5 < bucket._reserve(0) <= 1.1
+
+
+def test_token_bucket_charges_tokens_and_rebates(big):
+    bucket = big.AsyncTokenBucket(rpm=100, tpm=1000)
+    assert bucket._reserve(1000) == 0
+    assert bucket._reserve(500) > 0
+    bucket.rebate(10 ** 6)
+    assert bucket.tokens == 1000
+
+
+def test_token_bucket_acquire(big):
+    bucket = big.AsyncTokenBucket(rpm=600)
+    start = time.monotonic()
+    asyncio.run(bucket.acquire())
+    assert time.monotonic() - start < 0.5
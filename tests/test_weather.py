@@ -0,0 +1,21 @@
+def test_extract_all(big):
+    weather = {'daily': {'data': [{
+        'weather': 'sunny', 'summary': 'Clear',
+        'all_day': {'temperature': 20, 'temperature_min': 10, 'temperature_max': 25,
+                    'wind': {'speed': 3, 'dir': 'N'}, 'cloud_cover': {'total': 5}},
+    }]}}
+    context, icon = big.WeatherAPI.extract_all(weather)
+    assert icon == big.WeatherIconMapper.WEATHER_ICONS['sunny']
+    assert 'Temperature: 20°C (min: 10°C, max: 25°C)' in context
+    assert 'Wind: 3 m/s from N' in context and context.endswith('Cloud cover: 5%')
+
+
+def test_extract_all_without_data(big):
+    assert big.WeatherAPI.extract_all(None) == ('', '')
+    assert big.WeatherAPI.extract_all({'daily': {'data': []}}) == ('', big.WeatherIconMapper.DEFAULT_ICON)
+
+
+def test_extract_all_null_sections(big):
+    context, icon = big.WeatherAPI.extract_all({'daily': {'data': [{'weather': 'cloudy', 'all_day': None}]}})
+    assert context.startswith('Daily weather forecast: cloudy')
+    assert icon == big.WeatherIconMapper.WEATHER_ICONS['cloudy']